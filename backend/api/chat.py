@@ -230,7 +230,7 @@ async def stream_chat_response(
                 }
 
                 # Fetch transcript - this must complete before LLM starts
-                result = youtube_service.get_transcript(video_id)
+                result = youtube_service.get_transcript_by_id(video_id)
                 if result.success:
                     transcript = result.transcript
                     artifact_data["transcript_available"] = True
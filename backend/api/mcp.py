@@ -169,7 +169,7 @@ async def update_mcp_server(
 @router.delete("/mcp/servers/{server_id}")
 async def delete_mcp_server(server_id: str) -> dict:
     """Delete an MCP server configuration."""
-    if not mcp_service.delete_server(server_id):
+    if not await mcp_service.delete_server(server_id):
         raise HTTPException(status_code=404, detail="Server not found")
 
     return {"success": True, "message": "Server deleted"}
@@ -206,12 +206,18 @@ async def stop_mcp_server(server_id: str) -> dict:
 
 
 @router.get("/mcp/servers/{server_id}/tools")
-async def list_mcp_tools(server_id: str) -> list[dict]:
-    """List available tools from an MCP server."""
+async def list_mcp_tools(server_id: str, refresh: bool = False) -> list[dict]:
+    """List available tools from an MCP server.
+
+    Pass refresh=true to re-query the server instead of using the cached list.
+    """
     server = mcp_service.get_server(server_id)
     if not server:
         raise HTTPException(status_code=404, detail="Server not found")
 
+    if refresh:
+        return await mcp_service.refresh_tools(server_id)
+
     tools = await mcp_service.list_tools(server_id)
     return tools
 
@@ -1,5 +1,6 @@
 """Settings API endpoints."""
 
+import asyncio
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -8,7 +9,7 @@ from pydantic import BaseModel
 from config import settings
 from database.models import LLMProvider
 from database.repositories.config_repository import ConfigRepository
-from services.llm_service import llm_service
+from services.llm_service import invalidate_llm_config_cache, llm_service
 
 router = APIRouter()
 
@@ -91,7 +92,7 @@ async def get_settings() -> SettingsResponse:
             base_url=provider_settings["base_url"],
             api_key=provider_settings["api_key"],
             model=provider_settings["model"],
-            available=llm_service.is_available(),
+            available=await llm_service.is_available_async(),
             is_default=provider_settings["is_default"],
         ),
         app={
@@ -112,7 +113,7 @@ async def get_llm_settings() -> LLMSettingsResponse:
         base_url=provider_settings["base_url"],
         api_key=provider_settings["api_key"],
         model=provider_settings["model"],
-        available=llm_service.is_available(),
+        available=await llm_service.is_available_async(),
         is_default=provider_settings["is_default"],
     )
 
@@ -166,7 +167,7 @@ async def update_llm_settings(request: LLMSettingsRequest) -> LLMSettingsRespons
         base_url=provider.base_url,
         api_key=provider_for_use.api_key or "",
         model=provider.model or "",
-        available=llm_service.is_available(),
+        available=await llm_service.is_available_async(),
         is_default=True,
     )
 
@@ -216,9 +217,8 @@ async def get_all_providers_with_models() -> dict:
 
     providers = config_repo.get_all_llm_providers()
     default_provider = config_repo.get_default_llm_provider()
-    result = []
 
-    for provider in providers:
+    async def fetch_provider_models(provider: LLMProvider) -> dict:
         # Get decrypted credentials for fetching models
         provider_for_use = config_repo.get_llm_provider_for_use(provider.name)
 
@@ -237,7 +237,7 @@ async def get_all_providers_with_models() -> dict:
                 api_key=provider_for_use.api_key,
                 model=provider_for_use.model or "",
             )
-            models = service.get_models()
+            models = await service.get_models_async()
             provider_data["models"] = models
         except Exception as e:
             # If we can't fetch models, just include the configured model if any
@@ -245,7 +245,10 @@ async def get_all_providers_with_models() -> dict:
                 provider_data["models"] = [provider.model]
             provider_data["error"] = str(e)
 
-        result.append(provider_data)
+        return provider_data
+
+    # Probe all providers concurrently instead of one after another
+    result = list(await asyncio.gather(*(fetch_provider_models(p) for p in providers)))
 
     return {
         "providers": result,
@@ -298,6 +301,8 @@ async def update_llm_provider(name: str, request: LLMSettingsRequest) -> LLMProv
         )
         provider = config_repo.create_llm_provider(provider)
 
+    invalidate_llm_config_cache()
+
     return LLMProviderResponse(
         name=provider.name,
         base_url=provider.base_url,
@@ -313,6 +318,8 @@ async def delete_llm_provider(name: str) -> dict:
     if not config_repo.delete_llm_provider(name):
         raise HTTPException(status_code=404, detail=f"Provider '{name}' not found")
 
+    invalidate_llm_config_cache()
+
     return {"success": True, "message": f"Provider '{name}' deleted"}
 
 
@@ -351,7 +358,7 @@ async def set_default_llm_provider(name: str) -> LLMProviderResponse:
 @router.get("/settings/llm/models")
 async def get_available_models() -> dict:
     """Get list of available models from the LLM provider."""
-    models = llm_service.get_models()
+    models = await llm_service.get_models_async()
 
     return {
         "models": models,
@@ -363,7 +370,7 @@ async def get_available_models() -> dict:
 @router.get("/settings/llm/health")
 async def check_llm_health() -> dict:
     """Check LLM service health."""
-    available = llm_service.is_available()
+    available = await llm_service.is_available_async()
 
     return {
         "available": available,
@@ -390,7 +397,7 @@ async def test_llm_connection(request: LLMSettingsRequest) -> dict:
 
     try:
         # Try to get models first (lighter test)
-        models = test_service.get_models()
+        models = await test_service.get_models_async()
         if models:
             return {
                 "success": True,
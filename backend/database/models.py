@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 def generate_uuid() -> str:
@@ -71,6 +71,10 @@ class TranscriptSegment(BaseModel):
         return self.start + self.duration
 
 
+# Validates or serializes a whole transcript's segments in one call
+TRANSCRIPT_SEGMENTS_ADAPTER = TypeAdapter(list[TranscriptSegment])
+
+
 class Transcript(BaseModel):
     """YouTube video transcript model."""
 
@@ -1,11 +1,10 @@
 """Repository for transcript operations."""
 
-import json
 from datetime import datetime
 from typing import Optional
 
 from database.connection import get_db
-from database.models import Transcript, TranscriptSegment
+from database.models import TRANSCRIPT_SEGMENTS_ADAPTER, Transcript
 
 
 class TranscriptRepository:
@@ -13,14 +12,7 @@ class TranscriptRepository:
 
     def create(self, transcript: Transcript) -> Transcript:
         """Create a new transcript."""
-        raw_transcript = [
-            {
-                "text": seg.text,
-                "start": seg.start,
-                "duration": seg.duration,
-            }
-            for seg in transcript.segments
-        ]
+        raw_transcript = TRANSCRIPT_SEGMENTS_ADAPTER.dump_json(transcript.segments).decode()
 
         with get_db() as conn:
             conn.execute(
@@ -35,7 +27,7 @@ class TranscriptRepository:
                     transcript.video_title,
                     transcript.language_code,
                     int(transcript.is_generated),
-                    json.dumps(raw_transcript),
+                    raw_transcript,
                     transcript.created_at.isoformat(),
                 ),
             )
@@ -79,14 +71,7 @@ class TranscriptRepository:
 
     def update(self, transcript: Transcript) -> Transcript:
         """Update a transcript."""
-        raw_transcript = [
-            {
-                "text": seg.text,
-                "start": seg.start,
-                "duration": seg.duration,
-            }
-            for seg in transcript.segments
-        ]
+        raw_transcript = TRANSCRIPT_SEGMENTS_ADAPTER.dump_json(transcript.segments).decode()
 
         with get_db() as conn:
             conn.execute(
@@ -100,7 +85,7 @@ class TranscriptRepository:
                     transcript.video_title,
                     transcript.language_code,
                     int(transcript.is_generated),
-                    json.dumps(raw_transcript),
+                    raw_transcript,
                     transcript.id,
                 ),
             )
@@ -142,16 +127,8 @@ class TranscriptRepository:
 
     def _row_to_transcript(self, row) -> Transcript:
         """Convert a database row to a Transcript model."""
-        raw_transcript = json.loads(row["raw_transcript"]) if row["raw_transcript"] else []
-
-        segments = [
-            TranscriptSegment(
-                text=seg["text"],
-                start=seg["start"],
-                duration=seg["duration"],
-            )
-            for seg in raw_transcript
-        ]
+        raw_transcript = row["raw_transcript"]
+        segments = TRANSCRIPT_SEGMENTS_ADAPTER.validate_json(raw_transcript) if raw_transcript else []
 
         return Transcript(
             id=row["id"],
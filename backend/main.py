@@ -36,38 +36,23 @@ async def lifespan(app: FastAPI):
     init_db()
     logger.info("Database initialized")
 
-    # Auto-start enabled MCP servers
+    # Auto-start enabled MCP servers (concurrently - one failure doesn't stop others)
     from services.mcp_service import mcp_service
-    enabled_servers = mcp_service.get_enabled_servers()
-    started_count = 0
-    failed_count = 0
-    if enabled_servers:
-        logger.info(f"Auto-starting {len(enabled_servers)} enabled MCP server(s)...")
-        for server in enabled_servers:
-            try:
-                success = await mcp_service.start_server(server.id)
-                if success:
-                    logger.info(f"Started MCP server: {server.name}")
-                    started_count += 1
-                else:
-                    logger.warning(f"Failed to start MCP server: {server.name}")
-                    failed_count += 1
-            except Exception as e:
-                logger.error(f"Error starting MCP server {server.name}: {e}")
-                failed_count += 1
-                # Continue to next server - don't let one failure stop others
-                continue
+    results = await mcp_service.start_all_enabled()
+    if results:
+        started_count = sum(1 for started in results.values() if started)
+        failed_count = len(results) - started_count
         logger.info(f"MCP servers: {started_count} started, {failed_count} failed")
 
     yield
 
     # Shutdown - stop all running MCP servers
     logger.info("Shutting down LocalMind backend...")
-    for server_id in list(mcp_service._connections.keys()):
-        try:
-            await mcp_service.stop_server(server_id)
-        except Exception as e:
-            logger.error(f"Error stopping MCP server {server_id}: {e}")
+    await mcp_service.aclose()
+
+    # Close pooled LLM connections
+    from services.llm_providers.openai_compatible import aclose_shared_http_clients
+    await aclose_shared_http_clients()
 
 
 # Create FastAPI app
@@ -3,6 +3,7 @@
 import logging
 import os
 import tempfile
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
@@ -269,6 +270,9 @@ class DocumentService:
         if text_length == 0:
             return chunks
 
+        # All chunks of a document share one creation timestamp
+        now = datetime.utcnow()
+
         # If text is smaller than chunk size, return as single chunk
         if text_length <= self.chunk_size:
             chunks.append(
@@ -278,6 +282,7 @@ class DocumentService:
                     content=text.strip(),
                     char_start=0,
                     char_end=text_length,
+                    created_at=now,
                 )
             )
             return chunks
@@ -311,6 +316,7 @@ class DocumentService:
                         content=chunk_text,
                         char_start=start,
                         char_end=end,
+                        created_at=now,
                     )
                 )
                 chunk_index += 1
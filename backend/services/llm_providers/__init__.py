@@ -9,6 +9,7 @@ from .base import (
     MultimodalContent,
     ContentBlock,
     clean_llm_output,
+    clean_llm_stream_delta,
 )
 from .openai_compatible import OpenAICompatibleProvider
 from .ollama_provider import OllamaProvider
@@ -22,6 +23,7 @@ __all__ = [
     "MultimodalContent",
     "ContentBlock",
     "clean_llm_output",
+    "clean_llm_stream_delta",
     "OpenAICompatibleProvider",
     "OllamaProvider",
 ]
@@ -1,10 +1,17 @@
 """Base class for LLM providers."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import re
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Generator, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +20,9 @@ logger = logging.getLogger(__name__)
 ContentBlock = dict[str, Any]
 MultimodalContent = Union[str, list[ContentBlock]]
 
+# Interned chat roles, so role strings read from the database are shared
+_ROLES = {role: sys.intern(role) for role in ("system", "user", "assistant", "tool")}
+
 
 class ChatMessage(BaseModel):
     """A single chat message.
@@ -33,6 +43,30 @@ class ChatMessage(BaseModel):
     tool_calls: Optional[list[dict[str, Any]]] = None
     tool_call_id: Optional[str] = None
 
+    @field_validator("role")
+    @classmethod
+    def intern_role(cls, value: str) -> str:
+        """Reuse the interned string for known roles."""
+        return _ROLES.get(value) or sys.intern(value)
+
+    # Wire format computed on first use (messages are not mutated once built)
+    _openai_format: Optional[dict[str, Any]] = PrivateAttr(default=None)
+
+    def to_openai_format(self) -> dict[str, Any]:
+        """Return the message in OpenAI chat completions format.
+
+        The dict is built once and reused, so retries and tool-call follow-up
+        requests don't re-format the whole conversation history.
+        """
+        if self._openai_format is None:
+            formatted: dict[str, Any] = {"role": self.role, "content": self.content}
+            if self.tool_calls:
+                formatted["tool_calls"] = self.tool_calls
+            if self.tool_call_id:
+                formatted["tool_call_id"] = self.tool_call_id
+            self._openai_format = formatted
+        return self._openai_format
+
 
 class ToolCall(BaseModel):
     """Represents a tool call from the LLM."""
@@ -67,6 +101,9 @@ class StreamChunk(BaseModel):
     - "thinking": Reasoning/thinking content from models like deepseek-r1, qwen3
     - "tool_call": Tool/function call request
     - "done": Stream completion signal (includes metrics)
+
+    Providers build per-token chunks (and their partial metrics) with
+    model_construct, skipping validation for inputs they control.
     """
 
     type: str  # "content", "thinking", "tool_call", "done"
@@ -87,11 +124,46 @@ SPECIAL_TOKENS = [
 ]
 
 
+# Single-pass matcher for all special tokens
+_SPECIAL_TOKENS_RE = re.compile("|".join(re.escape(token) for token in SPECIAL_TOKENS))
+
+# Upper bound for a special token split across two streamed deltas
+_MAX_SPECIAL_TOKEN_LEN = max(len(token) for token in SPECIAL_TOKENS)
+
+# Maximum number of deterministic chat responses cached per provider instance
+CHAT_CACHE_MAX = 512
+
+
 def clean_llm_output(text: str) -> str:
     """Remove special tokens from LLM output."""
-    for token in SPECIAL_TOKENS:
-        text = text.replace(token, "")
-    return text
+    # Every special token starts with "<|", so most text skips the regex
+    if not text or "<|" not in text:
+        return text
+    return _SPECIAL_TOKENS_RE.sub("", text)
+
+
+def clean_llm_stream_delta(tail: str, text: str) -> tuple[str, str]:
+    """Clean a streamed delta, holding back a special token split across deltas.
+
+    Args:
+        tail: Text held back from the previous delta
+        text: The new delta
+
+    Returns:
+        Tuple of (text safe to emit, tail to prepend to the next delta)
+    """
+    if tail:
+        text = tail + text
+    if "<" not in text:
+        return text, ""
+
+    text = clean_llm_output(text)
+    start = text.rfind("<", max(0, len(text) - _MAX_SPECIAL_TOKEN_LEN + 1))
+    if start != -1:
+        candidate = text[start:]
+        if any(token.startswith(candidate) for token in SPECIAL_TOKENS):
+            return text[:start], candidate
+    return text, ""
 
 
 class BaseLLMProvider(ABC):
@@ -118,6 +190,71 @@ class BaseLLMProvider(ABC):
         self.api_key = api_key or ""
         self.model = model or ""
 
+        # Exact-match response cache for deterministic (temperature == 0) chats
+        self._chat_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._chat_cache_lock = threading.Lock()
+
+    def _chat_cache_key(
+        self,
+        messages: list[ChatMessage],
+        temperature: float,
+        max_tokens: Optional[int],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> Optional[bytes]:
+        """Build the response cache key for a chat request.
+
+        Only deterministic requests (temperature == 0) are cacheable. The key
+        covers the endpoint, model, token limit, tool schema and every message
+        in its wire format (including tool calls and tool call IDs).
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            tools: Optional tool definitions sent with the request
+
+        Returns:
+            The cache key, or None if the request should not be cached
+        """
+        if temperature != 0:
+            return None
+
+        payload = json.dumps(
+            [
+                self.base_url,
+                self.model,
+                max_tokens,
+                tools,
+                [m.to_openai_format() for m in messages],
+            ],
+            separators=(",", ":"),
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def _get_cached_chat(self, key: Optional[bytes]) -> Optional[str]:
+        """Return a cached chat response, or None on a miss."""
+        if key is None:
+            return None
+
+        with self._chat_cache_lock:
+            content = self._chat_cache.get(key)
+            if content is not None:
+                self._chat_cache.move_to_end(key)
+            return content
+
+    def _store_cached_chat(self, key: Optional[bytes], content: str) -> None:
+        """Store a chat response, evicting the least recently used entries."""
+        if key is None:
+            return
+
+        with self._chat_cache_lock:
+            self._chat_cache[key] = content
+            self._chat_cache.move_to_end(key)
+            while len(self._chat_cache) > CHAT_CACHE_MAX:
+                self._chat_cache.popitem(last=False)
+
     @abstractmethod
     def chat(
         self,
@@ -137,6 +274,27 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def chat_async(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Async version of chat.
+
+        Providers without a native async client run the sync request in a
+        worker thread.
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The generated response text
+        """
+        return await asyncio.to_thread(self.chat, messages, temperature, max_tokens)
+
     @abstractmethod
     def chat_stream(
         self,
@@ -178,6 +336,25 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def is_available_async(self) -> bool:
+        """Async version of is_available for concurrent health probes.
+
+        Providers without a native async client run the sync check in a
+        worker thread so the event loop is never blocked.
+
+        Returns:
+            True if the provider can accept requests
+        """
+        return await asyncio.to_thread(self.is_available)
+
+    async def get_models_async(self) -> list[str]:
+        """Async version of get_models for concurrent model listing.
+
+        Returns:
+            List of model identifiers
+        """
+        return await asyncio.to_thread(self.get_models)
+
     def update_config(
         self,
         base_url: Optional[str] = None,
@@ -198,13 +375,19 @@ class BaseLLMProvider(ABC):
         if model:
             self.model = model
 
-    def chat_stream_simple(
+        with self._chat_cache_lock:
+            self._chat_cache.clear()
+
+    def chat_stream_content_only(
         self,
         messages: list[ChatMessage],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
     ) -> Generator[str, None, None]:
-        """Simple streaming without tool support - yields content strings only.
+        """Stream content strings only, without tools or thinking detection.
+
+        Providers can override this with a leaner loop that skips building
+        StreamChunk objects. The default filters chat_stream.
 
         Args:
             messages: List of chat messages
@@ -217,3 +400,21 @@ class BaseLLMProvider(ABC):
         for chunk in self.chat_stream(messages, temperature, max_tokens, tools=None, think=False):
             if chunk.type == "content" and chunk.content:
                 yield chunk.content
+
+    def chat_stream_simple(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Generator[str, None, None]:
+        """Simple streaming without tool support - yields content strings only.
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generator of content strings
+        """
+        return self.chat_stream_content_only(messages, temperature, max_tokens)
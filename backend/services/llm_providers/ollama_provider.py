@@ -7,7 +7,8 @@ deepseek-r1 and qwen3.
 
 import json
 import logging
-from typing import Any, Generator, Optional
+import time
+from typing import Any, AsyncGenerator, Generator, Optional
 from urllib.parse import urlparse
 
 from .base import (
@@ -17,6 +18,7 @@ from .base import (
     StreamChunk,
     ToolCall,
     clean_llm_output,
+    clean_llm_stream_delta,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,14 +26,39 @@ logger = logging.getLogger(__name__)
 # Try to import ollama, handle gracefully if not installed
 try:
     import ollama
-    from ollama import Client
+    from ollama import AsyncClient, Client
     OLLAMA_AVAILABLE = True
 except ImportError:
     OLLAMA_AVAILABLE = False
     ollama = None
+    AsyncClient = None
     Client = None
 
 
+class _StreamState:
+    """Per-request bookkeeping shared by the sync and async stream loops."""
+
+    __slots__ = ("total_content_len", "pending_content", "start_time", "done")
+
+    def __init__(self) -> None:
+        # Accumulated thinking/content length for metrics estimation
+        self.total_content_len = 0
+        # Possible special-token prefix held back from the previous chunk
+        self.pending_content = ""
+        self.start_time = time.time()
+        self.done = False
+
+    def partial_metrics(self, elapsed: float) -> GenerationMetrics:
+        """Estimate running metrics (approx 4 chars per token)."""
+        completion_tokens = int(self.total_content_len / 4)
+        tps = completion_tokens / elapsed if elapsed > 0 else 0
+        return GenerationMetrics.model_construct(
+            completion_tokens=completion_tokens,
+            tokens_per_second=round(tps, 2),
+            total_duration=round(elapsed, 2)
+        )
+
+
 class OllamaProvider(BaseLLMProvider):
     """Provider for Ollama using the native ollama package.
 
@@ -56,13 +83,15 @@ class OllamaProvider(BaseLLMProvider):
         """
         super().__init__(base_url, api_key, model)
         self.client: Optional[Any] = None
+        self.async_client: Optional[Any] = None
         self._init_client()
 
     def _init_client(self) -> None:
-        """Initialize the Ollama client."""
+        """Initialize the Ollama clients (sync and async)."""
         if not OLLAMA_AVAILABLE:
             logger.warning("ollama package not installed. Run: pip install ollama")
             self.client = None
+            self.async_client = None
             return
 
         if self.base_url:
@@ -71,9 +100,11 @@ class OllamaProvider(BaseLLMProvider):
             parsed = urlparse(self.base_url)
             host = f"{parsed.scheme}://{parsed.netloc}"
             self.client = Client(host=host)
+            self.async_client = AsyncClient(host=host)
         else:
             # Use default localhost
             self.client = Client()
+            self.async_client = AsyncClient()
 
     def _ensure_client(self) -> bool:
         """Ensure the client is initialized.
@@ -131,6 +162,115 @@ class OllamaProvider(BaseLLMProvider):
 
         return formatted
 
+    def _final_metrics(self, chunk: Any) -> GenerationMetrics:
+        """Build generation metrics from Ollama's final (done) stream chunk.
+
+        Args:
+            chunk: The final chunk, which carries Ollama's timing counters
+
+        Returns:
+            GenerationMetrics for the completed generation
+        """
+        # Durations are in nanoseconds, convert to seconds
+        eval_count = chunk.get("eval_count", 0)
+        eval_duration_ns = chunk.get("eval_duration", 0)
+        prompt_eval_count = chunk.get("prompt_eval_count", 0)
+        prompt_eval_duration_ns = chunk.get("prompt_eval_duration", 0)
+        total_duration_ns = chunk.get("total_duration", 0)
+
+        eval_duration_s = eval_duration_ns / 1e9 if eval_duration_ns else None
+        prompt_eval_duration_s = prompt_eval_duration_ns / 1e9 if prompt_eval_duration_ns else None
+        total_duration_s = total_duration_ns / 1e9 if total_duration_ns else None
+
+        # Calculate tokens per second
+        tokens_per_second = None
+        if eval_count and eval_duration_s and eval_duration_s > 0:
+            tokens_per_second = eval_count / eval_duration_s
+
+        logger.info(f"Ollama generation metrics: {eval_count} tokens, {tokens_per_second:.2f} tok/s" if tokens_per_second else "Ollama generation complete (no metrics)")
+
+        return GenerationMetrics(
+            prompt_tokens=prompt_eval_count if prompt_eval_count else None,
+            completion_tokens=eval_count if eval_count else None,
+            total_tokens=(prompt_eval_count + eval_count) if (prompt_eval_count or eval_count) else None,
+            prompt_eval_duration=prompt_eval_duration_s,
+            eval_duration=eval_duration_s,
+            total_duration=total_duration_s,
+            tokens_per_second=round(tokens_per_second, 2) if tokens_per_second else None,
+        )
+
+    def _process_stream_chunk(self, chunk: Any, state: _StreamState) -> list[StreamChunk]:
+        """Turn one raw Ollama stream chunk into StreamChunks.
+
+        Args:
+            chunk: A chunk from the ollama client's chat stream
+            state: The stream's running state; ``state.done`` is set on the final chunk
+
+        Returns:
+            StreamChunks to yield, in order
+        """
+        out: list[StreamChunk] = []
+        message = chunk.get("message", {})
+        elapsed = time.time() - state.start_time
+
+        # Handle thinking content (separate from main content)
+        thinking = message.get("thinking")
+        if thinking:
+            state.total_content_len += len(thinking)
+            cleaned_thinking = clean_llm_output(thinking)
+            if cleaned_thinking:
+                out.append(StreamChunk.model_construct(
+                    type="thinking", thinking=cleaned_thinking, metrics=state.partial_metrics(elapsed)
+                ))
+
+        # Handle main content
+        content = message.get("content")
+        if content:
+            state.total_content_len += len(content)
+            cleaned_content, state.pending_content = clean_llm_stream_delta(state.pending_content, content)
+            if cleaned_content:
+                out.append(StreamChunk.model_construct(
+                    type="content", content=cleaned_content, metrics=state.partial_metrics(elapsed)
+                ))
+
+        # Handle tool calls
+        tool_calls = message.get("tool_calls")
+        if tool_calls:
+            for i, tc in enumerate(tool_calls):
+                func = tc.get("function", {})
+                tool_call = ToolCall(
+                    id=tc.get("id", f"call_{i}"),
+                    name=func.get("name", ""),
+                    arguments=func.get("arguments", {}),
+                )
+                out.append(StreamChunk(type="tool_call", tool_call=tool_call))
+
+        # Check if done - extract metrics from final chunk
+        if chunk.get("done"):
+            out.extend(self._finish_stream(state, self._final_metrics(chunk)))
+
+        return out
+
+    def _finish_stream(
+        self, state: _StreamState, metrics: Optional[GenerationMetrics] = None
+    ) -> list[StreamChunk]:
+        """Flush held-back content and signal completion.
+
+        Args:
+            state: The stream's running state
+            metrics: Final metrics, if the server reported them
+
+        Returns:
+            The trailing StreamChunks, ending with a "done" chunk
+        """
+        state.done = True
+        out: list[StreamChunk] = []
+        if state.pending_content:
+            out.append(StreamChunk(type="content", content=state.pending_content))
+            state.pending_content = ""
+        out.append(StreamChunk(type="done", metrics=metrics))
+        return out
+
     def chat(
         self,
         messages: list[ChatMessage],
@@ -143,6 +283,11 @@ class OllamaProvider(BaseLLMProvider):
                 "Ollama not available. Please install: pip install ollama"
             )
 
+        cache_key = self._chat_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_chat(cache_key)
+        if cached is not None:
+            return cached
+
         formatted_messages = self._format_messages(messages)
 
         options: dict[str, Any] = {"temperature": temperature}
@@ -156,13 +301,50 @@ class OllamaProvider(BaseLLMProvider):
                 options=options,
             )
 
-            content = response.get("message", {}).get("content", "")
-            return clean_llm_output(content)
+            content = clean_llm_output(response.get("message", {}).get("content", ""))
+            self._store_cached_chat(cache_key, content)
+            return content
 
         except Exception as e:
             logger.error(f"Ollama chat error: {e}")
             raise RuntimeError(f"Ollama chat failed: {e}")
 
+    async def chat_async(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Send a chat completion request using the async client."""
+        if not self._ensure_client() or self.async_client is None:
+            raise RuntimeError(
+                "Ollama not available. Please install: pip install ollama"
+            )
+
+        cache_key = self._chat_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_chat(cache_key)
+        if cached is not None:
+            return cached
+
+        options: dict[str, Any] = {"temperature": temperature}
+        if max_tokens:
+            options["num_predict"] = max_tokens
+
+        try:
+            response = await self.async_client.chat(
+                model=self.model,
+                messages=self._format_messages(messages),
+                options=options,
+            )
+
+            content = clean_llm_output(response.get("message", {}).get("content", ""))
+            self._store_cached_chat(cache_key, content)
+            return content
+
+        except Exception as e:
+            logger.error(f"Ollama async chat error: {e}")
+            raise RuntimeError(f"Ollama chat failed: {e}")
+
     def chat_stream(
         self,
         messages: list[ChatMessage],
@@ -241,105 +423,98 @@ class OllamaProvider(BaseLLMProvider):
                     raise
 
         try:
-            # Track accumulated content for metrics estimation
-            total_content_len = 0
-            import time
-            start_time = time.time()
-
+            state = _StreamState()
             for chunk in get_stream():
-                message = chunk.get("message", {})
-                
-                # Estimate metrics
-                elapsed = time.time() - start_time
-                partial_metrics = None
-                
-                # Handle thinking content (separate from main content)
-                thinking = message.get("thinking")
-                if thinking:
-                    total_content_len += len(thinking)
-                    cleaned_thinking = clean_llm_output(thinking)
-                    if cleaned_thinking:
-                        # Estimate tokens (approx 4 chars per token)
-                        completion_tokens = int(total_content_len / 4)
-                        tps = completion_tokens / elapsed if elapsed > 0 else 0
-                        partial_metrics = GenerationMetrics(
-                            completion_tokens=completion_tokens,
-                            tokens_per_second=round(tps, 2),
-                            total_duration=round(elapsed, 2)
-                        )
-                        yield StreamChunk(type="thinking", thinking=cleaned_thinking, metrics=partial_metrics)
-
-                # Handle main content
-                content = message.get("content")
-                if content:
-                    total_content_len += len(content)
-                    cleaned_content = clean_llm_output(content)
-                    if cleaned_content:
-                        # Estimate tokens
-                        completion_tokens = int(total_content_len / 4)
-                        tps = completion_tokens / elapsed if elapsed > 0 else 0
-                        partial_metrics = GenerationMetrics(
-                            completion_tokens=completion_tokens,
-                            tokens_per_second=round(tps, 2),
-                            total_duration=round(elapsed, 2)
-                        )
-                        yield StreamChunk(type="content", content=cleaned_content, metrics=partial_metrics)
-
-                # Handle tool calls
-                tool_calls = message.get("tool_calls")
-                if tool_calls:
-                    for i, tc in enumerate(tool_calls):
-                        func = tc.get("function", {})
-                        tool_call = ToolCall(
-                            id=tc.get("id", f"call_{i}"),
-                            name=func.get("name", ""),
-                            arguments=func.get("arguments", {}),
-                        )
-                        yield StreamChunk(type="tool_call", tool_call=tool_call)
-
-                # Check if done - extract metrics from final chunk
-                if chunk.get("done"):
-                    # Ollama returns metrics in the final chunk
-                    # Durations are in nanoseconds, convert to seconds
-                    eval_count = chunk.get("eval_count", 0)
-                    eval_duration_ns = chunk.get("eval_duration", 0)
-                    prompt_eval_count = chunk.get("prompt_eval_count", 0)
-                    prompt_eval_duration_ns = chunk.get("prompt_eval_duration", 0)
-                    total_duration_ns = chunk.get("total_duration", 0)
-
-                    # Convert nanoseconds to seconds
-                    eval_duration_s = eval_duration_ns / 1e9 if eval_duration_ns else None
-                    prompt_eval_duration_s = prompt_eval_duration_ns / 1e9 if prompt_eval_duration_ns else None
-                    total_duration_s = total_duration_ns / 1e9 if total_duration_ns else None
-
-                    # Calculate tokens per second
-                    tokens_per_second = None
-                    if eval_count and eval_duration_s and eval_duration_s > 0:
-                        tokens_per_second = eval_count / eval_duration_s
-
-                    metrics = GenerationMetrics(
-                        prompt_tokens=prompt_eval_count if prompt_eval_count else None,
-                        completion_tokens=eval_count if eval_count else None,
-                        total_tokens=(prompt_eval_count + eval_count) if (prompt_eval_count or eval_count) else None,
-                        prompt_eval_duration=prompt_eval_duration_s,
-                        eval_duration=eval_duration_s,
-                        total_duration=total_duration_s,
-                        tokens_per_second=round(tokens_per_second, 2) if tokens_per_second else None,
-                    )
-
-                    logger.info(f"Ollama generation metrics: {eval_count} tokens, {tokens_per_second:.2f} tok/s" if tokens_per_second else "Ollama generation complete (no metrics)")
-
-                    # Signal completion with metrics
-                    yield StreamChunk(type="done", metrics=metrics)
+                yield from self._process_stream_chunk(chunk, state)
+                if state.done:
                     return
 
             # Signal completion (fallback if loop exits without done)
-            yield StreamChunk(type="done")
+            yield from self._finish_stream(state)
 
         except Exception as e:
             logger.error(f"Ollama streaming error: {e}")
             raise RuntimeError(f"Ollama streaming failed: {e}")
 
+    async def chat_stream_async(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+        think: bool = True,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Async version of chat_stream using ollama's AsyncClient.
+
+        Network waits happen on the event loop instead of blocking it, so
+        concurrent chats don't stall each other.
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            tools: Optional list of tool definitions (Ollama tool support)
+            think: Whether to enable thinking/reasoning output
+
+        Yields:
+            StreamChunk objects with type "thinking", "content", "tool_call", or "done"
+        """
+        if not self._ensure_client() or self.async_client is None:
+            raise RuntimeError(
+                "Ollama not available. Please install: pip install ollama"
+            )
+
+        formatted_messages = self._format_messages(messages)
+
+        options: dict[str, Any] = {"temperature": temperature}
+        if max_tokens:
+            options["num_predict"] = max_tokens
+
+        request_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": formatted_messages,
+            "stream": True,
+            "options": options,
+        }
+        if think:
+            request_kwargs["think"] = True
+        if tools:
+            request_kwargs["tools"] = tools
+
+        logger.info(f"Ollama async streaming request: model={self.model}, think={think}, tools={len(tools) if tools else 0}")
+
+        # Helper to iterate through stream and handle thinking fallback
+        async def get_stream():
+            try:
+                async for chunk in await self.async_client.chat(**request_kwargs):
+                    yield chunk
+            except Exception as e:
+                # Some models don't support the think parameter
+                error_msg = str(e).lower()
+                if "think" in error_msg and "think" in request_kwargs:
+                    logger.warning(f"Model {self.model} doesn't support thinking, retrying without it")
+                    del request_kwargs["think"]
+                    async for chunk in await self.async_client.chat(**request_kwargs):
+                        yield chunk
+                else:
+                    raise
+
+        try:
+            state = _StreamState()
+            async for chunk in get_stream():
+                for out in self._process_stream_chunk(chunk, state):
+                    yield out
+                if state.done:
+                    return
+
+            # Signal completion (fallback if loop exits without done)
+            for out in self._finish_stream(state):
+                yield out
+
+        except Exception as e:
+            logger.error(f"Ollama async streaming error: {e}")
+            raise RuntimeError(f"Ollama streaming failed: {e}")
+
     def is_available(self) -> bool:
         """Check if Ollama is available."""
         if not self._ensure_client():
@@ -9,12 +9,17 @@ This provider works with any OpenAI-compatible API endpoint including:
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import re
 import time
-from typing import Any, AsyncGenerator, Generator, Optional
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Generator, Iterator, Optional
 
+import httpx
 from openai import AsyncOpenAI, OpenAI  # type: ignore
 
 from .base import (
@@ -24,8 +29,17 @@ from .base import (
     StreamChunk,
     ToolCall,
     clean_llm_output,
+    clean_llm_stream_delta,
 )
 
+# Prefer orjson for tool-call argument parsing when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # Patterns that indicate thinking/reasoning content in streamed responses
 THINKING_START_PATTERNS = [
     r"<think>",
@@ -42,6 +56,92 @@ THINKING_END_PATTERNS = [
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by every OpenAI client this module creates, so
+# keep-alive connections survive client recreation (update_config, per-request
+# LLMService instances). The OpenAI SDK still applies its own per-request
+# timeouts; these only act as defaults.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+_SHARED_HTTP_CLIENT = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+atexit.register(_SHARED_HTTP_CLIENT.close)
+
+# Async pools are tied to the event loop they run on, so one is created
+# lazily per running loop and replaced once it has been closed.
+_ASYNC_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async connection pool for the running event loop.
+
+    Raises:
+        RuntimeError: If called without a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        _ASYNC_HTTP_CLIENTS[loop] = client
+    return client
+
+
+# Per-context client overrides (e.g. a per-request API key). When unset,
+# providers use their own clients.
+_CLIENT_CTX: ContextVar[Optional[OpenAI]] = ContextVar("llm_client", default=None)
+_ASYNC_CLIENT_CTX: ContextVar[Optional[AsyncOpenAI]] = ContextVar("llm_async_client", default=None)
+
+
+@contextmanager
+def client_override(base_url: str, api_key: Optional[str] = None) -> Iterator[None]:
+    """Route OpenAI-compatible requests in the current context to other settings.
+
+    The override clients share the module-level connection pools, so no
+    extra sockets are opened. Responses are not cached while an override is
+    active, since the provider's cache is keyed by its own endpoint.
+
+    Args:
+        base_url: The API base URL to use
+        api_key: The API key to use (if required)
+    """
+    try:
+        async_http_client: Optional[httpx.AsyncClient] = _get_async_http_client()
+    except RuntimeError:
+        # No running loop; the async override client gets its own pool
+        async_http_client = None
+
+    client_token = _CLIENT_CTX.set(OpenAI(
+        base_url=base_url,
+        api_key=api_key or "not-required",
+        http_client=_SHARED_HTTP_CLIENT,
+    ))
+    async_token = _ASYNC_CLIENT_CTX.set(AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key or "not-required",
+        http_client=async_http_client,
+    ))
+    try:
+        yield
+    finally:
+        _ASYNC_CLIENT_CTX.reset(async_token)
+        _CLIENT_CTX.reset(client_token)
+
+
+async def aclose_shared_http_clients() -> None:
+    """Close the running loop's async connection pool (call on application shutdown).
+
+    A later async request opens a fresh pool, so a restarted lifespan keeps working.
+    """
+    client = _ASYNC_HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class OpenAICompatibleProvider(BaseLLMProvider):
     """Provider for OpenAI-compatible API endpoints."""
@@ -62,6 +162,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         super().__init__(base_url, api_key, model)
         self.client: Optional[OpenAI] = None
         self.async_client: Optional[AsyncOpenAI] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
         self._init_client()
 
     def _init_client(self) -> None:
@@ -70,14 +171,48 @@ class OpenAICompatibleProvider(BaseLLMProvider):
             self.client = OpenAI(
                 base_url=self.base_url,
                 api_key=self.api_key or "not-required",
+                http_client=_SHARED_HTTP_CLIENT,
             )
+        else:
+            self.client = None
+        # Built on first async use, against the running loop's pool
+        self.async_client = None
+        self._async_http_client = None
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """Return the async client, preferring a per-context override.
+
+        The provider's own client is rebuilt when the running loop's pool changes.
+        """
+        override = _ASYNC_CLIENT_CTX.get()
+        if override is not None:
+            return override
+
+        http_client = _get_async_http_client()
+        if self.async_client is None or self._async_http_client is not http_client:
             self.async_client = AsyncOpenAI(
                 base_url=self.base_url,
                 api_key=self.api_key or "not-required",
+                http_client=http_client,
             )
-        else:
-            self.client = None
-            self.async_client = None
+            self._async_http_client = http_client
+        return self.async_client
+
+    def _get_client(self) -> OpenAI:
+        """Return the sync client, preferring a per-context override."""
+        return _CLIENT_CTX.get() or self.client
+
+    def _chat_cache_key(
+        self,
+        messages: list[ChatMessage],
+        temperature: float,
+        max_tokens: Optional[int],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> Optional[bytes]:
+        """Build the response cache key, skipping requests routed by client_override."""
+        if _CLIENT_CTX.get() is not None or _ASYNC_CLIENT_CTX.get() is not None:
+            return None
+        return super()._chat_cache_key(messages, temperature, max_tokens, tools)
 
     def _ensure_client(self) -> bool:
         """Ensure the client is initialized.
@@ -94,6 +229,17 @@ class OpenAICompatibleProvider(BaseLLMProvider):
 
         return False
 
+    def _format_messages(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
+        """Format ChatMessage list to OpenAI format.
+
+        Args:
+            messages: List of ChatMessage objects
+
+        Returns:
+            List of message dicts in OpenAI format
+        """
+        return [msg.to_openai_format() for msg in messages]
+
     def chat(
         self,
         messages: list[ChatMessage],
@@ -104,19 +250,49 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         if not self._ensure_client():
             raise RuntimeError("LLM not configured. Please configure LLM settings first.")
 
-        formatted_messages = [
-            {"role": msg.role, "content": msg.content} for msg in messages
-        ]
+        cache_key = self._chat_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_chat(cache_key)
+        if cached is not None:
+            return cached
+
+        formatted_messages = self._format_messages(messages)
 
-        response = self.client.chat.completions.create(
+        response = self._get_client().chat.completions.create(
             model=self.model,
             messages=formatted_messages,
             temperature=temperature,
             max_tokens=max_tokens,
         )
 
-        content = response.choices[0].message.content or ""
-        return clean_llm_output(content)
+        content = clean_llm_output(response.choices[0].message.content or "")
+        self._store_cached_chat(cache_key, content)
+        return content
+
+    async def chat_async(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Send a chat completion request using the async client."""
+        if not self._ensure_client():
+            raise RuntimeError("LLM not configured. Please configure LLM settings first.")
+
+        cache_key = self._chat_cache_key(messages, temperature, max_tokens)
+        cached = self._get_cached_chat(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self._get_async_client().chat.completions.create(
+            model=self.model,
+            messages=self._format_messages(messages),
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+        content = clean_llm_output(response.choices[0].message.content or "")
+        self._store_cached_chat(cache_key, content)
+        return content
 
     def _detect_thinking_start(self, text: str) -> tuple[bool, str, str]:
         """Check if text contains a thinking start tag.
@@ -166,14 +342,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         if not self._ensure_client():
             raise RuntimeError("LLM not configured. Please configure LLM settings first.")
 
-        formatted_messages = []
-        for msg in messages:
-            formatted_msg: dict[str, Any] = {"role": msg.role, "content": msg.content}
-            if msg.tool_calls:
-                formatted_msg["tool_calls"] = msg.tool_calls
-            if msg.tool_call_id:
-                formatted_msg["tool_call_id"] = msg.tool_call_id
-            formatted_messages.append(formatted_msg)
+        formatted_messages = self._format_messages(messages)
 
         # Build request kwargs
         request_kwargs: dict[str, Any] = {
@@ -199,7 +368,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         prompt_tokens = 0
 
         try:
-            stream = self.client.chat.completions.create(**request_kwargs)
+            stream = self._get_client().chat.completions.create(**request_kwargs)
         except Exception as e:
             error_str = str(e).lower()
             # Handle various provider-specific limitations
@@ -213,7 +382,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     del request_kwargs["tools"]
                 if "tool_choice" in request_kwargs:
                     del request_kwargs["tool_choice"]
-                stream = self.client.chat.completions.create(**request_kwargs)
+                stream = self._get_client().chat.completions.create(**request_kwargs)
             # Check for stream_options issues
             elif ("stream_options" in error_str or
                   "unknown" in error_str or
@@ -222,7 +391,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 logger.warning(f"Provider may not support stream_options, retrying without it. Error: {e}")
                 if "stream_options" in request_kwargs:
                     del request_kwargs["stream_options"]
-                stream = self.client.chat.completions.create(**request_kwargs)
+                stream = self._get_client().chat.completions.create(**request_kwargs)
             # Generic 400 error - try removing both tools and stream_options
             elif "400" in error_str:
                 logger.warning(f"Got 400 error, retrying without tools and stream_options. Error: {e}")
@@ -232,7 +401,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     del request_kwargs["tool_choice"]
                 if "stream_options" in request_kwargs:
                     del request_kwargs["stream_options"]
-                stream = self.client.chat.completions.create(**request_kwargs)
+                stream = self._get_client().chat.completions.create(**request_kwargs)
             else:
                 raise
 
@@ -242,25 +411,35 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         # Track thinking state for tag-based detection
         in_thinking_block = False
         content_buffer = ""
+        # Possible special-token prefix held back from the previous delta
+        pending_text = ""
 
         for chunk in stream:
             # Handle usage stats (OpenAI sends this in a separate final chunk)
-            if hasattr(chunk, 'usage') and chunk.usage:
-                prompt_tokens = chunk.usage.prompt_tokens or 0
-                completion_tokens = chunk.usage.completion_tokens or 0
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                prompt_tokens = usage.prompt_tokens or 0
+                completion_tokens = usage.completion_tokens or 0
                 continue  # Usage chunk has no choices
 
-            if not chunk.choices:
+            # Bind per-chunk attributes to locals once
+            choices = chunk.choices
+            if not choices:
                 continue
-
-            delta = chunk.choices[0].delta
-
-            # Handle content with thinking detection
-            if delta.content:
-                content = clean_llm_output(delta.content)
-                if not content:
-                    continue
-
+            choice = choices[0]
+            delta = choice.delta
+            delta_content = delta.content
+            delta_tool_calls = delta.tool_calls
+            finish_reason = choice.finish_reason
+
+            # Handle content with thinking detection. A delta can clean down
+            # to nothing (e.g. a held-back token prefix) while the same chunk
+            # still carries tool calls or the finish reason handled below.
+            content = ""
+            if delta_content:
+                content, pending_text = clean_llm_stream_delta(pending_text, delta_content)
+
+            if content:
                 if think:
                     # Add to buffer for tag detection
                     content_buffer += content
@@ -269,7 +448,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     elapsed = time.time() - start_time
                     completion_tokens += int(len(content) / 4)
                     tps = completion_tokens / elapsed if elapsed > 0 else 0
-                    partial_metrics = GenerationMetrics(
+                    partial_metrics = GenerationMetrics.model_construct(
                         completion_tokens=completion_tokens,
                         tokens_per_second=round(tps, 2),
                         total_duration=round(elapsed, 2)
@@ -285,13 +464,13 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                                 if match:
                                     before_content = content_buffer[:match.start()]
                                     if before_content:
-                                        yield StreamChunk(type="content", content=before_content, metrics=partial_metrics)
+                                        yield StreamChunk.model_construct(type="content", content=before_content, metrics=partial_metrics)
                                     content_buffer = content_buffer[match.end():]
                                     in_thinking_block = True
                                     break
                         else:
                             # No thinking tag, yield content directly
-                            yield StreamChunk(type="content", content=content_buffer, metrics=partial_metrics)
+                            yield StreamChunk.model_construct(type="content", content=content_buffer, metrics=partial_metrics)
                             content_buffer = ""
 
                     # Check for thinking end tag (if in thinking block)
@@ -304,13 +483,13 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                                 if match:
                                     thinking_content = content_buffer[:match.start()]
                                     if thinking_content:
-                                        yield StreamChunk(type="thinking", thinking=thinking_content, metrics=partial_metrics)
+                                        yield StreamChunk.model_construct(type="thinking", thinking=thinking_content, metrics=partial_metrics)
                                     content_buffer = content_buffer[match.end():]
                                     in_thinking_block = False
                                     break
                         elif len(content_buffer) > 100:
                             # Yield thinking content in chunks to avoid buffering too much
-                            yield StreamChunk(type="thinking", thinking=content_buffer, metrics=partial_metrics)
+                            yield StreamChunk.model_construct(type="thinking", thinking=content_buffer, metrics=partial_metrics)
                             content_buffer = ""
                 else:
                     # Thinking detection disabled, yield as content directly
@@ -318,37 +497,33 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     elapsed = time.time() - start_time
                     completion_tokens += int(len(content) / 4)
                     tps = completion_tokens / elapsed if elapsed > 0 else 0
-                    partial_metrics = GenerationMetrics(
+                    partial_metrics = GenerationMetrics.model_construct(
                         completion_tokens=completion_tokens,
                         tokens_per_second=round(tps, 2),
                         total_duration=round(elapsed, 2)
                     )
-                    yield StreamChunk(type="content", content=content, metrics=partial_metrics)
+                    yield StreamChunk.model_construct(type="content", content=content, metrics=partial_metrics)
 
             # Handle tool calls
-            if delta.tool_calls:
-                for tool_call_delta in delta.tool_calls:
-                    idx = tool_call_delta.index
-
-                    # Initialize new tool call
-                    if idx not in current_tool_calls:
-                        current_tool_calls[idx] = {
-                            "id": "",
-                            "name": "",
-                            "arguments": "",
-                        }
+            if delta_tool_calls:
+                for tool_call_delta in delta_tool_calls:
+                    # Initialize new tool call on first sight of its index
+                    tc = current_tool_calls.setdefault(
+                        tool_call_delta.index,
+                        {"id": "", "name": "", "arg_parts": []},
+                    )
 
                     # Accumulate tool call data
                     if tool_call_delta.id:
-                        current_tool_calls[idx]["id"] = tool_call_delta.id
-                    if tool_call_delta.function:
-                        if tool_call_delta.function.name:
-                            current_tool_calls[idx]["name"] = tool_call_delta.function.name
-                        if tool_call_delta.function.arguments:
-                            current_tool_calls[idx]["arguments"] += tool_call_delta.function.arguments
+                        tc["id"] = tool_call_delta.id
+                    function = tool_call_delta.function
+                    if function:
+                        if function.name:
+                            tc["name"] = function.name
+                        if function.arguments:
+                            tc["arg_parts"].append(function.arguments)
 
             # Check for finish reason
-            finish_reason = chunk.choices[0].finish_reason
             if finish_reason:
                 logger.info(f"OpenAI-compatible finish_reason: {finish_reason}")
 
@@ -357,10 +532,11 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 logger.info(f"OpenAI-compatible requesting {len(current_tool_calls)} tool call(s)")
                 for idx in sorted(current_tool_calls.keys()):
                     tc = current_tool_calls[idx]
+                    raw_args = "".join(tc["arg_parts"])
                     try:
-                        args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse tool arguments: {tc['arguments']}")
+                        args = _json_loads(raw_args) if raw_args else {}
+                    except ValueError:  # Covers json and orjson decode errors
+                        logger.warning(f"Failed to parse tool arguments: {raw_args}")
                         args = {}
 
                     logger.info(f"  Tool call: {tc['name']} with args: {args}")
@@ -375,6 +551,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 current_tool_calls = {}
 
         # Flush any remaining buffer
+        content_buffer += pending_text
         if content_buffer:
             if in_thinking_block:
                 yield StreamChunk(type="thinking", thinking=content_buffer)
@@ -404,6 +581,51 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         # Signal completion with metrics
         yield StreamChunk(type="done", metrics=metrics)
 
+    def chat_stream_content_only(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Generator[str, None, None]:
+        """Stream content strings directly from the API deltas.
+
+        No tools, thinking detection or metrics, so no StreamChunk objects
+        are built per token.
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Content strings
+        """
+        if not self._ensure_client():
+            raise RuntimeError("LLM not configured. Please configure LLM settings first.")
+
+        request_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": self._format_messages(messages),
+            "temperature": temperature,
+            "stream": True,
+        }
+        if max_tokens:
+            request_kwargs["max_tokens"] = max_tokens
+
+        pending_text = ""
+        for chunk in self._get_client().chat.completions.create(**request_kwargs):
+            choices = chunk.choices
+            if not choices:
+                continue
+            delta_content = choices[0].delta.content
+            if delta_content:
+                content, pending_text = clean_llm_stream_delta(pending_text, delta_content)
+                if content:
+                    yield content
+
+        if pending_text:
+            yield pending_text
+
     async def chat_stream_async(
         self,
         messages: list[ChatMessage],
@@ -421,17 +643,10 @@ class OpenAICompatibleProvider(BaseLLMProvider):
             tools: Optional list of tool definitions
             think: Whether to enable thinking detection (default True)
         """
-        if not self._ensure_client() or not self.async_client:
+        if not self._ensure_client():
             raise RuntimeError("LLM not configured. Please configure LLM settings first.")
 
-        formatted_messages = []
-        for msg in messages:
-            formatted_msg: dict[str, Any] = {"role": msg.role, "content": msg.content}
-            if msg.tool_calls:
-                formatted_msg["tool_calls"] = msg.tool_calls
-            if msg.tool_call_id:
-                formatted_msg["tool_call_id"] = msg.tool_call_id
-            formatted_messages.append(formatted_msg)
+        formatted_messages = self._format_messages(messages)
 
         # Build request kwargs
         request_kwargs: dict[str, Any] = {
@@ -455,7 +670,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         prompt_tokens = 0
 
         try:
-            stream = await self.async_client.chat.completions.create(**request_kwargs)
+            stream = await self._get_async_client().chat.completions.create(**request_kwargs)
         except Exception as e:
             error_str = str(e).lower()
             # Handle various provider-specific limitations
@@ -467,7 +682,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     del request_kwargs["tools"]
                 if "tool_choice" in request_kwargs:
                     del request_kwargs["tool_choice"]
-                stream = await self.async_client.chat.completions.create(**request_kwargs)
+                stream = await self._get_async_client().chat.completions.create(**request_kwargs)
             elif ("stream_options" in error_str or
                   "unknown" in error_str or
                   "extra inputs" in error_str or
@@ -475,7 +690,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 logger.warning(f"Provider may not support stream_options, retrying without it. Error: {e}")
                 if "stream_options" in request_kwargs:
                     del request_kwargs["stream_options"]
-                stream = await self.async_client.chat.completions.create(**request_kwargs)
+                stream = await self._get_async_client().chat.completions.create(**request_kwargs)
             elif "400" in error_str:
                 logger.warning(f"Got 400 error, retrying without tools and stream_options. Error: {e}")
                 if "tools" in request_kwargs:
@@ -484,7 +699,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                     del request_kwargs["tool_choice"]
                 if "stream_options" in request_kwargs:
                     del request_kwargs["stream_options"]
-                stream = await self.async_client.chat.completions.create(**request_kwargs)
+                stream = await self._get_async_client().chat.completions.create(**request_kwargs)
             else:
                 raise
 
@@ -494,31 +709,41 @@ class OpenAICompatibleProvider(BaseLLMProvider):
         # Track thinking state for tag-based detection
         in_thinking_block = False
         content_buffer = ""
+        # Possible special-token prefix held back from the previous delta
+        pending_text = ""
 
         async for chunk in stream:
             # Handle usage stats
-            if hasattr(chunk, 'usage') and chunk.usage:
-                prompt_tokens = chunk.usage.prompt_tokens or 0
-                completion_tokens = chunk.usage.completion_tokens or 0
+            usage = getattr(chunk, "usage", None)
+            if usage:
+                prompt_tokens = usage.prompt_tokens or 0
+                completion_tokens = usage.completion_tokens or 0
                 continue
 
-            if not chunk.choices:
+            # Bind per-chunk attributes to locals once
+            choices = chunk.choices
+            if not choices:
                 continue
-
-            delta = chunk.choices[0].delta
-
-            # Handle content with thinking detection
-            if delta.content:
-                content = clean_llm_output(delta.content)
-                if not content:
-                    continue
-
+            choice = choices[0]
+            delta = choice.delta
+            delta_content = delta.content
+            delta_tool_calls = delta.tool_calls
+            finish_reason = choice.finish_reason
+
+            # Handle content with thinking detection. A delta can clean down
+            # to nothing (e.g. a held-back token prefix) while the same chunk
+            # still carries tool calls or the finish reason handled below.
+            content = ""
+            if delta_content:
+                content, pending_text = clean_llm_stream_delta(pending_text, delta_content)
+
+            if content:
                 if think:
                     content_buffer += content
                     elapsed = time.time() - start_time
                     completion_tokens += int(len(content) / 4)
                     tps = completion_tokens / elapsed if elapsed > 0 else 0
-                    partial_metrics = GenerationMetrics(
+                    partial_metrics = GenerationMetrics.model_construct(
                         completion_tokens=completion_tokens,
                         tokens_per_second=round(tps, 2),
                         total_duration=round(elapsed, 2)
@@ -532,12 +757,12 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                                 if match:
                                     before_content = content_buffer[:match.start()]
                                     if before_content:
-                                        yield StreamChunk(type="content", content=before_content, metrics=partial_metrics)
+                                        yield StreamChunk.model_construct(type="content", content=before_content, metrics=partial_metrics)
                                     content_buffer = content_buffer[match.end():]
                                     in_thinking_block = True
                                     break
                         else:
-                            yield StreamChunk(type="content", content=content_buffer, metrics=partial_metrics)
+                            yield StreamChunk.model_construct(type="content", content=content_buffer, metrics=partial_metrics)
                             content_buffer = ""
 
                     if in_thinking_block:
@@ -548,39 +773,40 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                                 if match:
                                     thinking_content = content_buffer[:match.start()]
                                     if thinking_content:
-                                        yield StreamChunk(type="thinking", thinking=thinking_content, metrics=partial_metrics)
+                                        yield StreamChunk.model_construct(type="thinking", thinking=thinking_content, metrics=partial_metrics)
                                     content_buffer = content_buffer[match.end():]
                                     in_thinking_block = False
                                     break
                         elif len(content_buffer) > 100:
-                            yield StreamChunk(type="thinking", thinking=content_buffer, metrics=partial_metrics)
+                            yield StreamChunk.model_construct(type="thinking", thinking=content_buffer, metrics=partial_metrics)
                             content_buffer = ""
                 else:
                     elapsed = time.time() - start_time
                     completion_tokens += int(len(content) / 4)
                     tps = completion_tokens / elapsed if elapsed > 0 else 0
-                    partial_metrics = GenerationMetrics(
+                    partial_metrics = GenerationMetrics.model_construct(
                         completion_tokens=completion_tokens,
                         tokens_per_second=round(tps, 2),
                         total_duration=round(elapsed, 2)
                     )
-                    yield StreamChunk(type="content", content=content, metrics=partial_metrics)
+                    yield StreamChunk.model_construct(type="content", content=content, metrics=partial_metrics)
 
             # Handle tool calls
-            if delta.tool_calls:
-                for tool_call_delta in delta.tool_calls:
-                    idx = tool_call_delta.index
-                    if idx not in current_tool_calls:
-                        current_tool_calls[idx] = {"id": "", "name": "", "arguments": ""}
+            if delta_tool_calls:
+                for tool_call_delta in delta_tool_calls:
+                    tc = current_tool_calls.setdefault(
+                        tool_call_delta.index,
+                        {"id": "", "name": "", "arg_parts": []},
+                    )
                     if tool_call_delta.id:
-                        current_tool_calls[idx]["id"] = tool_call_delta.id
-                    if tool_call_delta.function:
-                        if tool_call_delta.function.name:
-                            current_tool_calls[idx]["name"] = tool_call_delta.function.name
-                        if tool_call_delta.function.arguments:
-                            current_tool_calls[idx]["arguments"] += tool_call_delta.function.arguments
-
-            finish_reason = chunk.choices[0].finish_reason
+                        tc["id"] = tool_call_delta.id
+                    function = tool_call_delta.function
+                    if function:
+                        if function.name:
+                            tc["name"] = function.name
+                        if function.arguments:
+                            tc["arg_parts"].append(function.arguments)
+
             if finish_reason:
                 logger.info(f"OpenAI-compatible async finish_reason: {finish_reason}")
 
@@ -588,10 +814,11 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 logger.info(f"OpenAI-compatible async requesting {len(current_tool_calls)} tool call(s)")
                 for idx in sorted(current_tool_calls.keys()):
                     tc = current_tool_calls[idx]
+                    raw_args = "".join(tc["arg_parts"])
                     try:
-                        args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse tool arguments: {tc['arguments']}")
+                        args = _json_loads(raw_args) if raw_args else {}
+                    except ValueError:  # Covers json and orjson decode errors
+                        logger.warning(f"Failed to parse tool arguments: {raw_args}")
                         args = {}
                     logger.info(f"  Tool call: {tc['name']} with args: {args}")
                     yield StreamChunk(
@@ -601,6 +828,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
                 current_tool_calls = {}
 
         # Flush remaining buffer
+        content_buffer += pending_text
         if content_buffer:
             if in_thinking_block:
                 yield StreamChunk(type="thinking", thinking=content_buffer)
@@ -629,7 +857,7 @@ class OpenAICompatibleProvider(BaseLLMProvider):
 
         try:
             # Try to list models as a health check
-            self.client.models.list()
+            self._get_client().models.list()
             return True
         except Exception:
             return False
@@ -640,7 +868,29 @@ class OpenAICompatibleProvider(BaseLLMProvider):
             return []
 
         try:
-            models = self.client.models.list()
+            models = self._get_client().models.list()
+            return [model.id for model in models.data]
+        except Exception:
+            return []
+
+    async def is_available_async(self) -> bool:
+        """Check if the provider is available without blocking the event loop."""
+        if not self._ensure_client():
+            return False
+
+        try:
+            await self._get_async_client().models.list()
+            return True
+        except Exception:
+            return False
+
+    async def get_models_async(self) -> list[str]:
+        """Get list of available models without blocking the event loop."""
+        if not self._ensure_client():
+            return []
+
+        try:
+            models = await self._get_async_client().models.list()
             return [model.id for model in models.data]
         except Exception:
             return []
@@ -6,8 +6,15 @@ This service supports multiple LLM providers using native packages:
 - Others: OpenAI-compatible API (vLLM, llama.cpp, Cerebras, Mistral)
 """
 
+import asyncio
 import logging
-from typing import Any, AsyncGenerator, Generator, Optional
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional
 
 from .llm_providers import (
     BaseLLMProvider,
@@ -21,6 +28,9 @@ from .llm_providers import (
     OllamaProvider,
 )
 
+if TYPE_CHECKING:
+    from database.repositories.config_repository import ConfigRepository
+
 logger = logging.getLogger(__name__)
 
 # Re-export types for backward compatibility
@@ -49,13 +59,35 @@ PROVIDER_CLASSES = {
 }
 
 
+# Known provider URL markers, checked in priority order (first match wins)
+_PROVIDER_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (name, re.compile(pattern, re.IGNORECASE))
+    for name, pattern in (
+        ("ollama", r"11434|ollama"),
+        ("openai", r"api\.openai\.com"),
+        ("claude", r"api\.anthropic\.com"),
+        ("gemini", r"generativelanguage\.googleapis\.com"),
+        ("cerebras", r"cerebras"),
+        ("mistral", r"mistral"),
+    )
+)
+
+# Recently built providers, reused so switching configs keeps warm clients
+_PROVIDER_POOL: OrderedDict[tuple[str, str, str, str], BaseLLMProvider] = OrderedDict()
+_PROVIDER_POOL_MAX = 8
+_provider_pool_lock = threading.Lock()
+
+
 def get_provider(
     provider_name: str,
     base_url: str,
     api_key: Optional[str] = None,
     model: Optional[str] = None,
 ) -> BaseLLMProvider:
-    """Factory function to create the appropriate provider instance.
+    """Factory function to get the appropriate provider instance.
+
+    Providers are pooled by configuration, so repeated calls with the same
+    settings return the same instance (and its connection pool).
 
     Args:
         provider_name: Name of the provider (ollama, openai, cerebras, etc.)
@@ -66,31 +98,120 @@ def get_provider(
     Returns:
         An instance of the appropriate provider class
     """
-    provider_class = PROVIDER_CLASSES.get(provider_name.lower(), OpenAICompatibleProvider)
-    return provider_class(base_url=base_url, api_key=api_key, model=model)
+    key = (provider_name.lower(), base_url, api_key or "", model or "")
+
+    with _provider_pool_lock:
+        provider = _PROVIDER_POOL.get(key)
+        if provider is not None:
+            _PROVIDER_POOL.move_to_end(key)
+            return provider
+
+    provider_class = PROVIDER_CLASSES.get(key[0], OpenAICompatibleProvider)
+    provider = provider_class(base_url=base_url, api_key=api_key, model=model)
+
+    with _provider_pool_lock:
+        # Another thread may have built the same provider meanwhile
+        existing = _PROVIDER_POOL.get(key)
+        if existing is not None:
+            _PROVIDER_POOL.move_to_end(key)
+            return existing
+
+        _PROVIDER_POOL[key] = provider
+        while len(_PROVIDER_POOL) > _PROVIDER_POOL_MAX:
+            # Evicted providers share the module-level HTTP pools, so
+            # there is nothing to close here
+            _PROVIDER_POOL.popitem(last=False)
+
+    return provider
+
+
+# Cached default provider config: (monotonic timestamp, config dict)
+_CONFIG_CACHE: Optional[tuple[float, dict]] = None
+_CONFIG_TTL = 30.0  # seconds
+_config_cache_lock = threading.Lock()
+# Repository used for config lookups, created on first use
+_CONFIG_REPO: Optional["ConfigRepository"] = None
+
+
+# Endpoints whose connection pool has already been warmed in this process
+_PREWARMED_ENDPOINTS: set[tuple[str, str]] = set()
+_prewarm_lock = threading.Lock()
+
+
+# Short-lived endpoint probe caches: (provider, base_url, api_key) -> (expires_at, value)
+_MODELS_TTL = 15.0  # seconds
+_AVAILABLE_TTL = 5.0
+_FAILED_PROBE_TTL = 1.0  # Failures expire quickly so recovery is noticed
+_models_cache: dict[tuple[str, str, str], tuple[float, list[str]]] = {}
+_available_cache: dict[tuple[str, str, str], tuple[float, bool]] = {}
+
+
+def _get_cached_probe(cache: dict, key: tuple[str, str, str]) -> Any:
+    """Return a cached probe result, or None if missing or expired."""
+    entry = cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_probe(cache: dict, key: tuple[str, str, str], value: Any, ok: bool, ttl: float) -> None:
+    """Cache a probe result, using the short failure TTL when not ok."""
+    cache[key] = (time.monotonic() + (ttl if ok else _FAILED_PROBE_TTL), value)
+
+
+def _invalidate_probe_caches(base_url: str) -> None:
+    """Drop cached probe results for an endpoint."""
+    for cache in (_models_cache, _available_cache):
+        for key in [k for k in list(cache) if k[1] == base_url]:
+            cache.pop(key, None)
 
 
 def _get_llm_config_from_db() -> dict:
-    """Get LLM configuration from the database (llm_providers table)."""
-    try:
+    """Get LLM configuration from the database (llm_providers table).
+
+    Results are cached for _CONFIG_TTL seconds so the hot request path
+    doesn't pay for a SQL query and API key decryption on every call.
+    """
+    global _CONFIG_CACHE, _CONFIG_REPO
+
+    cached = _CONFIG_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _CONFIG_TTL:
+        return dict(cached[1])
+
+    if _CONFIG_REPO is None:
+        # Imported lazily to avoid a circular import at module load
         from database.repositories.config_repository import ConfigRepository
-        config_repo = ConfigRepository()
+        _CONFIG_REPO = ConfigRepository()
 
+    try:
         # Get default provider with decrypted API key
-        default_provider = config_repo.get_default_llm_provider_for_use()
-        if default_provider:
-            return {
-                "provider": default_provider.name,
-                "base_url": default_provider.base_url,
-                "api_key": default_provider.api_key or "",
-                "model": default_provider.model or "",
-            }
-
-        return {}
-    except Exception:
-        # Database might not be initialized yet
+        default_provider = _CONFIG_REPO.get_default_llm_provider_for_use()
+    except sqlite3.Error as e:
+        # Database might not be initialized yet (don't cache the failure)
+        logger.warning(f"Could not load LLM provider config from database: {e}")
         return {}
 
+    config: dict = {}
+    if default_provider:
+        config = {
+            "provider": default_provider.name,
+            "base_url": default_provider.base_url,
+            "api_key": default_provider.api_key or "",
+            "model": default_provider.model or "",
+        }
+
+    with _config_cache_lock:
+        _CONFIG_CACHE = (time.monotonic(), config)
+    return dict(config)
+
+
+def invalidate_llm_config_cache() -> None:
+    """Drop the cached default provider config."""
+    global _CONFIG_CACHE
+
+    with _config_cache_lock:
+        _CONFIG_CACHE = None
+
 
 class LLMService:
     """Service for interacting with LLM providers.
@@ -145,21 +266,9 @@ class LLMService:
         if not base_url:
             return "openai_compatible"
 
-        base_url_lower = base_url.lower()
-
-        # Check for known provider URLs
-        if "11434" in base_url_lower or "ollama" in base_url_lower:
-            return "ollama"
-        elif "api.openai.com" in base_url_lower:
-            return "openai"
-        elif "api.anthropic.com" in base_url_lower:
-            return "claude"
-        elif "generativelanguage.googleapis.com" in base_url_lower:
-            return "gemini"
-        elif "cerebras" in base_url_lower:
-            return "cerebras"
-        elif "mistral" in base_url_lower:
-            return "mistral"
+        for name, pattern in _PROVIDER_PATTERNS:
+            if pattern.search(base_url):
+                return name
 
         return "openai_compatible"
 
@@ -172,9 +281,39 @@ class LLMService:
                 api_key=self.api_key,
                 model=self.model,
             )
+            self._schedule_prewarm()
         else:
             self._provider = None
 
+    def _schedule_prewarm(self) -> None:
+        """Open a connection to the endpoint in the background.
+
+        The first real request then reuses a live keep-alive connection instead
+        of paying for the TCP/TLS handshake. Each endpoint is warmed at most
+        once per process so repeated update_config calls don't stampede it.
+        """
+        key = (self._provider_name, self.base_url)
+        with _prewarm_lock:
+            if key in _PREWARMED_ENDPOINTS:
+                return
+            _PREWARMED_ENDPOINTS.add(key)
+
+        provider = self._provider
+        threading.Thread(
+            target=self._prewarm,
+            args=(provider,),
+            name="llm-prewarm",
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _prewarm(provider: BaseLLMProvider) -> None:
+        """Issue a cheap request to establish the pooled connection."""
+        try:
+            provider.is_available()
+        except Exception as e:
+            logger.debug(f"LLM prewarm failed: {e}")
+
     def _ensure_provider(self) -> bool:
         """Ensure the provider is initialized.
 
@@ -196,6 +335,10 @@ class LLMService:
 
         return False
 
+    def _probe_key(self) -> tuple[str, str, str]:
+        """Key identifying this endpoint in the probe caches."""
+        return (self._provider_name, self.base_url, self.api_key or "")
+
     @property
     def provider_name(self) -> str:
         """Get the current provider name."""
@@ -222,6 +365,85 @@ class LLMService:
 
         return self._provider.chat(messages, temperature, max_tokens)
 
+    async def chat_async(
+        self,
+        messages: list[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Async version of chat.
+
+        Args:
+            messages: List of chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            The generated response text
+        """
+        if not self._ensure_provider():
+            raise RuntimeError("LLM not configured. Please configure LLM settings first.")
+
+        return await self._provider.chat_async(messages, temperature, max_tokens)
+
+    async def batch_chat(
+        self,
+        batches: list[list[ChatMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """Run several independent chat requests concurrently.
+
+        Continuous-batching servers (vLLM, Ollama, TGI) merge concurrent
+        requests into shared decode steps, so this is much faster than
+        sending them one after another. max_concurrency caps the number of
+        in-flight requests to stay within backend limits.
+
+        Args:
+            batches: One message list per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            The generated responses, in the same order as batches
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(messages: list[ChatMessage]) -> str:
+            async with semaphore:
+                return await self.chat_async(messages, temperature, max_tokens)
+
+        return list(await asyncio.gather(*(run_one(messages) for messages in batches)))
+
+    def batch_chat_sync(
+        self,
+        batches: list[list[ChatMessage]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """Blocking version of batch_chat for callers outside the event loop.
+
+        Uses a thread pool over the sync client rather than a private event
+        loop, since the pooled async connections belong to the app's loop.
+
+        Args:
+            batches: One message list per request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            The generated responses, in the same order as batches
+        """
+        if not batches:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as pool:
+            return list(pool.map(lambda messages: self.chat(messages, temperature, max_tokens), batches))
+
     def chat_stream(
         self,
         messages: list[ChatMessage],
@@ -299,9 +521,11 @@ class LLMService:
         Yields:
             Content strings
         """
-        for chunk in self.chat_stream(messages, temperature, max_tokens, tools=None, think=False):
-            if chunk.type == "content" and chunk.content:
-                yield chunk.content
+        if not self._ensure_provider():
+            raise RuntimeError("LLM not configured. Please configure LLM settings first.")
+
+        # Providers filter content at the source, without StreamChunk wrapping
+        yield from self._provider.chat_stream_content_only(messages, temperature, max_tokens)
 
     def is_available(self) -> bool:
         """Check if the LLM endpoint is available.
@@ -312,7 +536,14 @@ class LLMService:
         if not self._ensure_provider():
             return False
 
-        return self._provider.is_available()
+        key = self._probe_key()
+        cached = _get_cached_probe(_available_cache, key)
+        if cached is not None:
+            return cached
+
+        available = self._provider.is_available()
+        _store_probe(_available_cache, key, available, available, _AVAILABLE_TTL)
+        return available
 
     def get_models(self) -> list[str]:
         """Get list of available models.
@@ -323,7 +554,50 @@ class LLMService:
         if not self._ensure_provider():
             return []
 
-        return self._provider.get_models()
+        key = self._probe_key()
+        cached = _get_cached_probe(_models_cache, key)
+        if cached is not None:
+            return list(cached)
+
+        models = self._provider.get_models()
+        _store_probe(_models_cache, key, list(models), bool(models), _MODELS_TTL)
+        return models
+
+    async def is_available_async(self) -> bool:
+        """Async version of is_available, safe to gather across providers.
+
+        Returns:
+            True if the provider can accept requests
+        """
+        if not self._ensure_provider():
+            return False
+
+        key = self._probe_key()
+        cached = _get_cached_probe(_available_cache, key)
+        if cached is not None:
+            return cached
+
+        available = await self._provider.is_available_async()
+        _store_probe(_available_cache, key, available, available, _AVAILABLE_TTL)
+        return available
+
+    async def get_models_async(self) -> list[str]:
+        """Async version of get_models, safe to gather across providers.
+
+        Returns:
+            List of model identifiers
+        """
+        if not self._ensure_provider():
+            return []
+
+        key = self._probe_key()
+        cached = _get_cached_probe(_models_cache, key)
+        if cached is not None:
+            return list(cached)
+
+        models = await self._provider.get_models_async()
+        _store_probe(_models_cache, key, list(models), bool(models), _MODELS_TTL)
+        return models
 
     def update_config(
         self,
@@ -340,6 +614,8 @@ class LLMService:
             model: New model
             provider_name: New provider name
         """
+        _invalidate_probe_caches(self.base_url)
+
         if base_url:
             self.base_url = base_url
         if api_key:
@@ -354,6 +630,10 @@ class LLMService:
 
         # Recreate the provider with new settings
         self._init_provider()
+        _invalidate_probe_caches(self.base_url)
+
+        # The default provider may have changed in the database
+        invalidate_llm_config_cache()
 
 
 # Global LLM service instance
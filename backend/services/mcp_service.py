@@ -4,7 +4,8 @@ import asyncio
 import json
 import logging
 from contextlib import AsyncExitStack
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Optional
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -14,34 +15,77 @@ from database.repositories.config_repository import ConfigRepository
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for serializing MCP config when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds to wait for an MCP server to shut down
+MCP_STOP_TIMEOUT = 5.0
+
+# Upper bound on memoized tool conversions before the memo is reset
+MAX_CONVERTED_TOOLS = 1024
+
 
 class MCPServerConnection:
     """Manages a single MCP server connection using the official SDK."""
 
+    __slots__ = ("server", "session", "exit_stack", "_tools_cache", "_owner_task", "_stop_event")
+
     def __init__(self, server: MCPServer):
         self.server = server
         self.session: Optional[ClientSession] = None
         self.exit_stack: Optional[AsyncExitStack] = None
         self._tools_cache: Optional[list[dict[str, Any]]] = None
+        # Task that owns the SDK contexts for the connection's whole lifetime
+        self._owner_task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
 
     async def connect(self) -> bool:
-        """Connect to the MCP server."""
+        """Connect to the MCP server.
+
+        The SDK's stdio transport and session hold anyio cancel scopes that
+        must be entered and exited by the same task. The connection is
+        therefore opened, served and closed by one long-lived owner task, so
+        connect() and disconnect() may be called from any task.
+        """
         if self.session is not None:
             return True
 
-        try:
-            self.exit_stack = AsyncExitStack()
-
-            if self.server.transport_type == "stdio":
-                return await self._connect_stdio()
-            else:
-                logger.error(f"Unsupported transport type: {self.server.transport_type}")
-                return False
+        if self.server.transport_type != "stdio":
+            logger.error(f"Unsupported transport type: {self.server.transport_type}")
+            return False
 
+        ready: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._stop_event = asyncio.Event()
+        self._owner_task = asyncio.create_task(
+            self._run(ready), name=f"mcp-server:{self.server.name}"
+        )
+        try:
+            return await asyncio.shield(ready)
+        except asyncio.CancelledError:
+            # The owner task closes whatever it has opened
+            self._stop_event.set()
+            raise
+
+    async def _run(self, ready: "asyncio.Future[bool]") -> None:
+        """Owner task: open the connection, wait for disconnect(), then close it."""
+        try:
+            async with AsyncExitStack() as exit_stack:
+                self.exit_stack = exit_stack
+                connected = await self._connect_stdio()
+                ready.set_result(connected)
+                if connected:
+                    await self._stop_event.wait()
         except Exception as e:
-            logger.error(f"Failed to connect to MCP server {self.server.name}: {e}")
-            await self.disconnect()
-            return False
+            logger.error(f"MCP server {self.server.name} connection failed: {e}")
+        finally:
+            self.exit_stack = None
+            self.session = None
+            self.invalidate_tools()
+            if not ready.done():
+                ready.set_result(False)
 
     async def _connect_stdio(self) -> bool:
         """Connect to a stdio-based MCP server."""
@@ -52,8 +96,8 @@ class MCPServerConnection:
         # Build args list
         args = self.server.args or []
 
-        # Build environment
-        env = dict(self.server.env) if self.server.env else None
+        # Build environment (StdioServerParameters only reads env, so no copy is needed)
+        env = self.server.env or None
 
         server_params = StdioServerParameters(
             command=self.server.command,
@@ -64,25 +108,28 @@ class MCPServerConnection:
         try:
             # Use the official MCP SDK's stdio_client with timeout
             # This prevents hanging if the server process crashes or hangs during startup
-            stdio_transport = await asyncio.wait_for(
-                self.exit_stack.enter_async_context(stdio_client(server_params)),
-                timeout=30.0
-            )
+            # asyncio.timeout runs in the current task (unlike wait_for), so the
+            # SDK's task groups are entered and exited by the same task
+            async with asyncio.timeout(30.0):
+                stdio_transport = await self.exit_stack.enter_async_context(
+                    stdio_client(server_params)
+                )
             read_stream, write_stream = stdio_transport
 
             # Create and initialize session with timeout
-            self.session = await asyncio.wait_for(
-                self.exit_stack.enter_async_context(ClientSession(read_stream, write_stream)),
-                timeout=10.0
-            )
+            async with asyncio.timeout(10.0):
+                self.session = await self.exit_stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
 
             # Initialize the MCP session (required handshake) with timeout
-            await asyncio.wait_for(self.session.initialize(), timeout=30.0)
+            async with asyncio.timeout(30.0):
+                await self.session.initialize()
 
             logger.info(f"Connected to MCP server: {self.server.name}")
             return True
 
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.error(f"Timeout connecting to MCP server {self.server.name}")
             return False
         except Exception as e:
@@ -90,80 +137,136 @@ class MCPServerConnection:
             return False
 
     async def disconnect(self) -> None:
-        """Disconnect from the MCP server."""
-        if self.exit_stack:
-            try:
-                await self.exit_stack.aclose()
-            except Exception as e:
-                logger.warning(f"Error closing MCP server {self.server.name}: {e}")
-            finally:
-                self.exit_stack = None
-                self.session = None
-                self._tools_cache = None
-
-    async def list_tools(self) -> list[dict[str, Any]]:
-        """List available tools from the MCP server."""
+        """Disconnect from the MCP server.
+
+        Signals the owner task and waits for it to close the session and the
+        server process.
+        """
+        task = self._owner_task
+        if task is None:
+            return
+
+        self._stop_event.set()
+        # wait() doesn't cancel the owner task if this caller is cancelled
+        await asyncio.wait({task})
+        self._owner_task = None
+        self._stop_event = None
+
+    def abort(self) -> None:
+        """Cancel the owner task without waiting for a clean shutdown.
+
+        Last resort for a server that doesn't close within the stop timeout;
+        the SDK contexts are unwound by the cancellation.
+        """
+        if self._owner_task is not None:
+            self._owner_task.cancel()
+
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool list so the next list_tools call re-queries the server."""
+        self._tools_cache = None
+
+    async def list_tools(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """List available tools from the MCP server.
+
+        The tool list is cached for the lifetime of the connection; pass
+        refresh=True to query the server again.
+        """
         if not self.session:
             return []
 
+        if self._tools_cache is not None and not refresh:
+            return self._tools_cache
+
         try:
             # Add timeout to prevent hanging
-            response = await asyncio.wait_for(
-                self.session.list_tools(),
-                timeout=30.0
-            )
-            tools = []
-            for tool in response.tools:
-                tools.append({
+            async with asyncio.timeout(30.0):
+                response = await self.session.list_tools()
+            tools = [
+                {
                     "name": tool.name,
                     "description": tool.description or "",
-                    "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
-                })
+                    "inputSchema": getattr(tool, 'inputSchema', None) or {},
+                }
+                for tool in response.tools
+            ]
             self._tools_cache = tools
             logger.info(f"Listed {len(tools)} tools from {self.server.name}")
             return tools
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.error(f"Timeout listing tools from {self.server.name}")
             return []
         except Exception as e:
             logger.error(f"Failed to list tools from {self.server.name}: {e}")
             return []
 
+    @staticmethod
+    def _extract_content(content: Any) -> Any:
+        """Extract the payload of a single MCP content block."""
+        text = getattr(content, 'text', None)
+        if text is not None:
+            return text
+        data = getattr(content, 'data', None)
+        if data is not None:
+            return data
+        if hasattr(content, 'model_dump'):
+            # Other SDK blocks (e.g. embedded resources) stay structured
+            # instead of being rendered through str()
+            return content.model_dump(mode="json", exclude_none=True)
+        return content
+
+    async def call_tool_stream(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> AsyncGenerator[Any, None]:
+        """Call a tool on the MCP server and yield its content blocks one at a time.
+
+        A result without content blocks is yielded as-is. Errors (including
+        timeouts) are raised to the caller.
+
+        Args:
+            tool_name: Name of the tool on this server
+            arguments: Tool arguments
+
+        Yields:
+            Extracted content block payloads
+        """
+        if not self.session:
+            raise RuntimeError("Server not connected")
+
+        # Add timeout to prevent hanging (60s for tool execution)
+        async with asyncio.timeout(60.0):
+            result = await self.session.call_tool(tool_name, arguments)
+
+        # MCP returns content as a list of content blocks
+        content_list = getattr(result, 'content', None)
+        if not content_list:
+            yield result
+            return
+
+        for content in content_list:
+            yield self._extract_content(content)
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call a tool on the MCP server."""
         if not self.session:
             return {"error": "Server not connected"}
 
-        logger.info(f"Calling tool {tool_name} on {self.server.name} with args: {arguments}")
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Calling tool {tool_name} on {self.server.name} with args: {arguments}")
 
         try:
-            # Add timeout to prevent hanging (60s for tool execution)
-            result = await asyncio.wait_for(
-                self.session.call_tool(tool_name, arguments),
-                timeout=60.0
-            )
-
-            # Extract content from the result
-            if hasattr(result, 'content') and result.content:
-                # MCP returns content as a list of content blocks
-                contents = []
-                for content in result.content:
-                    if hasattr(content, 'text'):
-                        contents.append(content.text)
-                    elif hasattr(content, 'data'):
-                        contents.append(content.data)
-                    else:
-                        contents.append(str(content))
-
-                if len(contents) == 1:
-                    logger.info(f"Tool {tool_name} returned: {contents[0][:200]}...")
-                    return contents[0]
+            contents = [block async for block in self.call_tool_stream(tool_name, arguments)]
+
+            if len(contents) == 1:
+                if log_info:
+                    preview = contents[0][:200] if isinstance(contents[0], str) else type(contents[0]).__name__
+                    logger.info(f"Tool {tool_name} returned: {preview}...")
+                return contents[0]
+            if log_info:
                 logger.info(f"Tool {tool_name} returned {len(contents)} content blocks")
-                return contents
+            return contents
 
-            return result
-
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.error(f"Timeout calling tool {tool_name} on {self.server.name}")
             return {"error": f"Tool {tool_name} execution timed out after 60s"}
         except Exception as e:
@@ -175,14 +278,63 @@ class MCPServerConnection:
         """Check if the server is connected."""
         return self.session is not None
 
+    @property
+    def has_cached_tools(self) -> bool:
+        """Check if the tool list has been fetched and cached."""
+        return self._tools_cache is not None
+
+
+@dataclass(slots=True)
+class ServerState:
+    """Runtime state of a single MCP server."""
+
+    status: str = "stopped"
+    conn: Optional[MCPServerConnection] = None
+
 
 class MCPService:
     """Service for managing MCP servers using the official SDK."""
 
     def __init__(self):
         self.config_repo = ConfigRepository()
-        self._connections: dict[str, MCPServerConnection] = {}
-        self._server_status: dict[str, str] = {}
+        # server_id -> connection and last known status
+        self._servers: dict[str, ServerState] = {}
+        # server_id -> (MCP tool list it was converted from, OpenAI-format tools)
+        self._openai_tools_cache: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {}
+        # (server name, tool name, description, schema JSON) -> OpenAI tool definition
+        self._converted_tools: dict[tuple[str, str, Optional[str], str], dict[str, Any]] = {}
+        # Bumped whenever server configuration or running state changes
+        self._epoch = 0
+        # (epoch, enabled servers whose tools are offered to the LLM)
+        self._tool_servers_cache: Optional[tuple[int, list[MCPServer]]] = None
+        # (epoch, OpenAI-format tools, tool name -> server_id)
+        self._all_tools_cache: Optional[tuple[int, list[dict[str, Any]], dict[str, str]]] = None
+
+    def _connection(self, server_id: str) -> Optional[MCPServerConnection]:
+        """Get the connection of a started server, if any."""
+        state = self._servers.get(server_id)
+        return state.conn if state is not None else None
+
+    def _bump_epoch(self) -> None:
+        """Mark cached server state as stale."""
+        self._epoch += 1
+
+    def _get_tool_servers(self) -> list[MCPServer]:
+        """Get enabled servers whose tools should be offered, cached per epoch.
+
+        Only running stdio servers and SSE servers are included.
+        """
+        cached = self._tool_servers_cache
+        if cached is not None and cached[0] == self._epoch:
+            return cached[1]
+
+        epoch = self._epoch
+        servers = [
+            server for server in self.get_enabled_servers()
+            if server.transport_type != "stdio" or self.is_server_running(server.id)
+        ]
+        self._tool_servers_cache = (epoch, servers)
+        return servers
 
     def get_all_servers(self) -> list[MCPServer]:
         """Get all configured MCP servers."""
@@ -198,29 +350,48 @@ class MCPService:
 
     def create_server(self, server: MCPServer) -> MCPServer:
         """Create a new MCP server configuration."""
-        return self.config_repo.create_mcp_server(server)
+        server = self.config_repo.create_mcp_server(server)
+        self._bump_epoch()
+        return server
 
     def update_server(self, server: MCPServer) -> MCPServer:
         """Update an MCP server configuration."""
-        return self.config_repo.update_mcp_server(server)
-
-    def delete_server(self, server_id: str) -> bool:
-        """Delete an MCP server configuration."""
-        # Stop the server if it's running
-        if server_id in self._connections:
-            asyncio.create_task(self.stop_server(server_id))
-        return self.config_repo.delete_mcp_server(server_id)
+        # Tool names are prefixed with the server name, so drop converted tools
+        self._openai_tools_cache.pop(server.id, None)
+        conn = self._connection(server.id)
+        if conn:
+            conn.invalidate_tools()
+        server = self.config_repo.update_mcp_server(server)
+        self._bump_epoch()
+        return server
+
+    async def delete_server(self, server_id: str) -> bool:
+        """Delete an MCP server configuration.
+
+        A running server is stopped (and its process reaped) before the
+        configuration is removed.
+        """
+        if self._connection(server_id) is not None:
+            await self.stop_server(server_id)
+        self._servers.pop(server_id, None)
+        self._openai_tools_cache.pop(server_id, None)
+        deleted = self.config_repo.delete_mcp_server(server_id)
+        self._bump_epoch()
+        return deleted
 
     def is_server_running(self, server_id: str) -> bool:
         """Check if a server is running."""
-        conn = self._connections.get(server_id)
+        conn = self._connection(server_id)
         return conn is not None and conn.is_connected
 
     def get_server_status(self, server_id: str) -> str:
         """Get the status of a server."""
-        if self.is_server_running(server_id):
+        state = self._servers.get(server_id)
+        if state is None:
+            return "stopped"
+        if state.conn is not None and state.conn.is_connected:
             return "running"
-        return self._server_status.get(server_id, "stopped")
+        return state.status
 
     async def start_server(self, server_id: str) -> bool:
         """Start an MCP server.
@@ -243,8 +414,9 @@ class MCPService:
             success = await conn.connect()
 
             if success:
-                self._connections[server_id] = conn
-                self._server_status[server_id] = "running"
+                self._servers[server_id] = ServerState(status="running", conn=conn)
+                self._openai_tools_cache.pop(server_id, None)
+                self._bump_epoch()
                 logger.info(f"Started MCP server: {server.name}")
                 return True
             else:
@@ -254,7 +426,7 @@ class MCPService:
                         await conn.disconnect()
                     except Exception:
                         pass
-                self._server_status[server_id] = "error: failed to connect"
+                self._servers[server_id] = ServerState(status="error: failed to connect")
                 logger.warning(f"MCP server {server.name} failed to start (check server logs above)")
                 return False
 
@@ -267,34 +439,128 @@ class MCPService:
                     pass
             error_msg = str(e)
             logger.error(f"Failed to start server {server.name}: {error_msg}")
-            self._server_status[server_id] = f"error: {error_msg[:100]}"
+            self._servers[server_id] = ServerState(status=f"error: {error_msg[:100]}")
             return False
 
+    async def start_all_enabled(self, concurrency: int = 8) -> dict[str, bool]:
+        """Start all enabled MCP servers concurrently.
+
+        Connection handshakes run in parallel (bounded by concurrency), so
+        startup takes about as long as the slowest server instead of the sum.
+        Each connection lives in its own owner task, so starting servers from
+        the gathered tasks doesn't tie them to those tasks.
+
+        Args:
+            concurrency: Maximum number of servers starting at once
+
+        Returns:
+            Dict mapping server_id to whether it started
+        """
+        servers = self.get_enabled_servers()
+        if not servers:
+            return {}
+
+        logger.info(f"Auto-starting {len(servers)} enabled MCP server(s)...")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def start_one(server_id: str) -> bool:
+            async with semaphore:
+                return await self.start_server(server_id)
+
+        results = await asyncio.gather(
+            *(start_one(server.id) for server in servers),
+            return_exceptions=True,
+        )
+
+        started: dict[str, bool] = {}
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error starting MCP server {server.name}: {result}")
+                started[server.id] = False
+            else:
+                started[server.id] = result
+        return started
+
     async def stop_server(self, server_id: str) -> bool:
-        """Stop a running MCP server."""
-        conn = self._connections.get(server_id)
+        """Stop a running MCP server.
+
+        Returns False (and marks the server as errored) if it doesn't shut
+        down within MCP_STOP_TIMEOUT seconds.
+        """
+        state = self._servers.get(server_id)
+        conn = state.conn if state is not None else None
         if not conn:
             logger.info(f"Server {server_id} is not running")
             return True
 
         try:
-            await conn.disconnect()
-            del self._connections[server_id]
-            self._server_status[server_id] = "stopped"
+            try:
+                # The SDK terminates the server process when the session closes;
+                # don't let a wedged server block the caller indefinitely
+                async with asyncio.timeout(MCP_STOP_TIMEOUT):
+                    await conn.disconnect()
+            except TimeoutError:
+                # Fall back to cancelling the owner task. The process may
+                # outlive it, so report the failure and the command to look for.
+                conn.abort()
+                state.conn = None
+                state.status = f"error: did not stop within {MCP_STOP_TIMEOUT}s"
+                self._openai_tools_cache.pop(server_id, None)
+                self._bump_epoch()
+                command = " ".join([conn.server.command or "", *(conn.server.args or [])])
+                logger.error(
+                    f"Timed out stopping server {server_id}; its process may still be running: {command}"
+                )
+                return False
+            state.conn = None
+            state.status = "stopped"
+            self._openai_tools_cache.pop(server_id, None)
+            self._bump_epoch()
             logger.info(f"Stopped server {server_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to stop server {server_id}: {e}")
             return False
 
+    async def aclose(self) -> None:
+        """Stop all running MCP servers concurrently.
+
+        Called on application shutdown so no server process outlives the
+        backend. Each connection is torn down by its own owner task, so the
+        stops can run concurrently from this task.
+        """
+        server_ids = [server_id for server_id, state in self._servers.items() if state.conn is not None]
+        if not server_ids:
+            return
+
+        results = await asyncio.gather(
+            *(self.stop_server(server_id) for server_id in server_ids),
+            return_exceptions=True,
+        )
+        for server_id, result in zip(server_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error stopping MCP server {server_id}: {result}")
+
     async def list_tools(self, server_id: str) -> list[dict[str, Any]]:
         """List available tools from an MCP server."""
-        conn = self._connections.get(server_id)
+        conn = self._connection(server_id)
         if not conn or not conn.is_connected:
             return []
 
         return await conn.list_tools()
 
+    async def refresh_tools(self, server_id: str) -> list[dict[str, Any]]:
+        """Re-query the tool list of a running MCP server, bypassing caches."""
+        conn = self._connection(server_id)
+        if not conn or not conn.is_connected:
+            return []
+
+        self._openai_tools_cache.pop(server_id, None)
+        tools = await conn.list_tools(refresh=True)
+        # Bump after the query so a concurrent read can't cache the old list
+        self._bump_epoch()
+        return tools
+
     async def call_tool(
         self,
         server_id: str,
@@ -302,142 +568,126 @@ class MCPService:
         arguments: dict[str, Any],
     ) -> Any:
         """Call a tool on an MCP server."""
-        conn = self._connections.get(server_id)
+        conn = self._connection(server_id)
         if not conn or not conn.is_connected:
             return {"error": "Server not running"}
 
         return await conn.call_tool(tool_name, arguments)
 
-    async def get_all_tools_as_openai_format(self) -> tuple[list[dict[str, Any]], dict[str, str]]:
-        """Get all tools from enabled/running MCP servers in OpenAI function format.
+    async def call_tool_stream(
+        self,
+        server_id: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> AsyncGenerator[Any, None]:
+        """Call a tool on an MCP server, yielding content blocks as they are extracted.
 
-        Returns:
-            Tuple of (tools_list, tool_to_server_map) where:
-            - tools_list: List of tools in OpenAI function format
-            - tool_to_server_map: Dict mapping tool name to server_id
+        Raises:
+            RuntimeError: If the server is not running
         """
-        all_tools: list[dict[str, Any]] = []
-        tool_to_server: dict[str, str] = {}
-
-        for server_id, conn in self._connections.items():
-            if not conn.is_connected:
-                continue
-
-            try:
-                tools = await conn.list_tools()
-                for tool in tools:
-                    openai_tool = self._convert_mcp_tool_to_openai(tool, conn.server.name)
-                    if openai_tool:
-                        all_tools.append(openai_tool)
-                        tool_name = openai_tool["function"]["name"]
-                        tool_to_server[tool_name] = server_id
-            except Exception as e:
-                logger.warning(f"Failed to get tools from server {conn.server.name}: {e}")
-
-        return all_tools, tool_to_server
-
-    def _convert_mcp_tool_to_openai(
-        self, mcp_tool: dict[str, Any], server_name: str
-    ) -> Optional[dict[str, Any]]:
-        """Convert an MCP tool definition to OpenAI function format."""
-        try:
-            tool_name = mcp_tool.get("name")
-            if not tool_name:
-                return None
-
-            # Prefix tool name with server name to avoid collisions
-            prefixed_name = f"{server_name}__{tool_name}"
-
-            function_def: dict[str, Any] = {
-                "name": prefixed_name,
-                "description": mcp_tool.get("description", f"Tool from {server_name}"),
-            }
-
-            # Convert input schema
-            input_schema = mcp_tool.get("inputSchema", mcp_tool.get("input_schema", {}))
-            if input_schema:
-                function_def["parameters"] = {
-                    "type": input_schema.get("type", "object"),
-                    "properties": input_schema.get("properties", {}),
-                    "required": input_schema.get("required", []),
-                }
-            else:
-                function_def["parameters"] = {
-                    "type": "object",
-                    "properties": {},
-                }
+        conn = self._connection(server_id)
+        if not conn or not conn.is_connected:
+            raise RuntimeError("Server not running")
 
-            return {
-                "type": "function",
-                "function": function_def,
-            }
+        async for block in conn.call_tool_stream(tool_name, arguments):
+            yield block
 
-        except Exception as e:
-            logger.warning(f"Failed to convert MCP tool to OpenAI format: {e}")
-            return None
+    @staticmethod
+    def _server_to_config(server: MCPServer) -> dict[str, Any]:
+        """Build the mcpServers entry for a single server."""
+        if server.transport_type != "stdio":
+            return {"url": server.url}
 
-    def parse_tool_name(self, prefixed_name: str) -> tuple[str, str]:
-        """Parse a prefixed tool name back to server_name and tool_name."""
-        if "__" in prefixed_name:
-            parts = prefixed_name.split("__", 1)
-            return parts[0], parts[1]
-        return "", prefixed_name
+        server_config: dict[str, Any] = {"command": server.command}
+        if server.args:
+            server_config["args"] = server.args
+        if server.env:
+            server_config["env"] = server.env
+        return server_config
 
     def create_mcp_config_json(self, servers: Optional[list[MCPServer]] = None) -> str:
         """Generate MCP configuration JSON for external tools."""
         if servers is None:
             servers = self.get_enabled_servers()
 
-        config = {"mcpServers": {}}
+        config = {
+            "mcpServers": {server.name: self._server_to_config(server) for server in servers}
+        }
 
-        for server in servers:
-            server_config: dict[str, Any] = {}
+        if orjson is not None:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(config, indent=2)
 
-            if server.transport_type == "stdio":
-                server_config["command"] = server.command
-                if server.args:
-                    server_config["args"] = server.args
-                if server.env:
-                    server_config["env"] = server.env
-            else:
-                server_config["url"] = server.url
+    async def _get_server_openai_tools(self, server: MCPServer) -> list[dict[str, Any]]:
+        """Get one server's tools in OpenAI function format.
+
+        Reuses the converted tools while the cached MCP tool list is unchanged.
+        """
+        tools = await self.list_tools(server.id)
 
-            config["mcpServers"][server.name] = server_config
+        cached = self._openai_tools_cache.get(server.id)
+        if cached is not None and cached[0] is tools:
+            return cached[1]
 
-        return json.dumps(config, indent=2)
+        openai_tools = []
+        for tool in tools:
+            # Convert MCP tool to OpenAI function format
+            openai_tool = self._convert_mcp_tool_to_openai(tool, server.name)
+            if openai_tool:
+                openai_tools.append(openai_tool)
+        self._openai_tools_cache[server.id] = (tools, openai_tools)
+        return openai_tools
 
     async def get_all_tools_as_openai_format(self) -> tuple[list[dict[str, Any]], dict[str, str]]:
         """Get all tools from enabled/running MCP servers in OpenAI function format.
 
+        Servers are queried concurrently, so the total latency is that of the
+        slowest server rather than the sum over all servers. The result is
+        cached until a server is created, updated, deleted, started, stopped
+        or has its tools refreshed.
+
         Returns:
             Tuple of (tools_list, tool_to_server_map) where:
             - tools_list: List of tools in OpenAI function format
             - tool_to_server_map: Dict mapping tool name to server_id
         """
+        cached = self._all_tools_cache
+        if cached is not None and cached[0] == self._epoch:
+            # Callers append their own tools, so hand out copies
+            return list(cached[1]), dict(cached[2])
+
+        epoch = self._epoch
         all_tools: list[dict[str, Any]] = []
         tool_to_server: dict[str, str] = {}
+        # Don't cache results that would hide a transient listing failure
+        complete = True
 
-        # Get enabled servers
-        enabled_servers = self.get_enabled_servers()
+        servers = self._get_tool_servers()
 
-        for server in enabled_servers:
-            # Only include tools from running stdio servers or SSE servers
-            if server.transport_type == "stdio" and not self.is_server_running(server.id):
+        results = await asyncio.gather(
+            *(self._get_server_openai_tools(server) for server in servers),
+            return_exceptions=True,
+        )
+
+        for server, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to get tools from server {server.name}: {result}")
+                complete = False
                 continue
 
-            try:
-                tools = await self.list_tools(server.id)
-                for tool in tools:
-                    # Convert MCP tool to OpenAI function format
-                    openai_tool = self._convert_mcp_tool_to_openai(tool, server.name)
-                    if openai_tool:
-                        all_tools.append(openai_tool)
-                        # Use prefixed name for mapping
-                        tool_name = openai_tool["function"]["name"]
-                        tool_to_server[tool_name] = server.id
-            except Exception as e:
-                logger.warning(f"Failed to get tools from server {server.name}: {e}")
+            conn = self._connection(server.id)
+            if conn is not None and not conn.has_cached_tools:
+                complete = False
+
+            for openai_tool in result:
+                all_tools.append(openai_tool)
+                # Use prefixed name for mapping
+                tool_name = openai_tool["function"]["name"]
+                tool_to_server[tool_name] = server.id
 
+        if complete and epoch == self._epoch:
+            self._all_tools_cache = (epoch, all_tools, tool_to_server)
+            return list(all_tools), dict(tool_to_server)
         return all_tools, tool_to_server
 
     def _convert_mcp_tool_to_openai(
@@ -457,6 +707,19 @@ class MCPService:
             if not tool_name:
                 return None
 
+            input_schema = mcp_tool.get("inputSchema", mcp_tool.get("input_schema", {}))
+
+            # Reuse the previous conversion of an identical tool definition
+            memo_key = (
+                server_name,
+                tool_name,
+                mcp_tool.get("description"),
+                json.dumps(input_schema, sort_keys=True, default=str),
+            )
+            converted = self._converted_tools.get(memo_key)
+            if converted is not None:
+                return converted
+
             # Prefix tool name with server name to avoid collisions
             prefixed_name = f"{server_name}__{tool_name}"
 
@@ -467,7 +730,6 @@ class MCPService:
             }
 
             # Convert input schema
-            input_schema = mcp_tool.get("inputSchema", mcp_tool.get("input_schema", {}))
             if input_schema:
                 # OpenAI expects parameters in specific format
                 function_def["parameters"] = {
@@ -482,11 +744,16 @@ class MCPService:
                     "properties": {},
                 }
 
-            return {
+            converted = {
                 "type": "function",
                 "function": function_def,
             }
 
+            if len(self._converted_tools) >= MAX_CONVERTED_TOOLS:
+                self._converted_tools.clear()
+            self._converted_tools[memo_key] = converted
+            return converted
+
         except Exception as e:
             logger.warning(f"Failed to convert MCP tool to OpenAI format: {e}")
             return None
@@ -500,9 +767,9 @@ class MCPService:
         Returns:
             Tuple of (server_name, tool_name)
         """
-        if "__" in prefixed_name:
-            parts = prefixed_name.split("__", 1)
-            return parts[0], parts[1]
+        server_name, sep, tool_name = prefixed_name.partition("__")
+        if sep:
+            return server_name, tool_name
         return "", prefixed_name
 
 
@@ -1,19 +1,43 @@
 """YouTube transcript extraction service."""
 
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Generator, Optional
 
+import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
+from youtube_transcript_api._errors import TranscriptsDisabled, VideoUnavailable
 
-from database.models import Transcript, TranscriptSegment
+from database.models import TRANSCRIPT_SEGMENTS_ADAPTER, Transcript
 from database.repositories.transcript_repository import TranscriptRepository
 from utils.youtube_utils import build_youtube_url, extract_video_id
 
+# Transcript availability rarely changes, so listings and permanent failures
+# are cached per video to avoid repeat round-trips to YouTube
+_LANGUAGES_TTL = 3600.0  # seconds
+_FAILURE_TTL = 600.0
+_CACHE_MAX_ENTRIES = 1024
+_languages_cache: dict[str, tuple[float, dict]] = {}
+_failure_cache: dict[str, tuple[float, tuple[str, str]]] = {}
+
+
+def _get_cached(cache: dict[str, tuple[float, Any]], video_id: str) -> Any:
+    """Return a cached value, or None if missing or expired."""
+    entry = cache.get(video_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_cached(cache: dict[str, tuple[float, Any]], video_id: str, value: Any, ttl: float) -> None:
+    """Cache a value, evicting the oldest entry when the cache is full."""
+    if video_id not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)), None)
+    cache[video_id] = (time.monotonic() + ttl, value)
+
 
 class TranscriptResult(BaseModel):
     """Result of a transcript extraction attempt."""
@@ -30,7 +54,18 @@ class YouTubeService:
 
     def __init__(self):
         self.transcript_repo = TranscriptRepository()
-        self.api = YouTubeTranscriptApi()
+
+        # Shared keep-alive session so repeated and parallel fetches reuse connections
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ),
+        )
+        self.api = YouTubeTranscriptApi(http_client=self._session)
 
     def get_transcript(
         self,
@@ -58,6 +93,28 @@ class YouTubeService:
                 error_message="Could not extract a valid YouTube video ID from the provided URL.",
             )
 
+        return self.get_transcript_by_id(video_id, languages, use_cache)
+
+    def get_transcript_by_id(
+        self,
+        video_id: str,
+        languages: list[str] = ["en", "hi", "es", "fr", "de", "pt", "ja", "ko", "zh"],
+        use_cache: bool = True,
+    ) -> TranscriptResult:
+        """
+        Get the transcript for an already extracted YouTube video ID.
+
+        Callers that hold a validated video ID (e.g. from find_youtube_urls)
+        can use this to skip URL parsing.
+
+        Args:
+            video_id: The 11-character YouTube video ID
+            languages: Preferred languages in order
+            use_cache: Whether to use cached transcripts
+
+        Returns:
+            TranscriptResult with success status and transcript or error info
+        """
         # Check cache first
         if use_cache:
             cached = self.transcript_repo.get_by_video_id(video_id)
@@ -68,63 +125,65 @@ class YouTubeService:
                     transcript=cached,
                 )
 
+            failure = _get_cached(_failure_cache, video_id)
+            if failure is not None:
+                return TranscriptResult(
+                    success=False,
+                    video_id=video_id,
+                    error_type=failure[0],
+                    error_message=failure[1],
+                )
+
         # Fetch from YouTube using the new API
         try:
             # First, list available transcripts to find the best one
             transcript_list = self.api.list(video_id)
 
-            # Try to find a transcript in preferred languages
+            # Partition the available transcripts in one pass
+            manual = {}
+            generated = {}
+            first_available = None
+            for candidate in transcript_list:
+                if first_available is None:
+                    first_available = candidate
+                (generated if candidate.is_generated else manual).setdefault(
+                    candidate.language_code, candidate
+                )
+
+            # Prefer manually created transcripts in the preferred languages, then
+            # auto-generated ones, then any available transcript
+            transcript = (
+                next((manual[code] for code in languages if code in manual), None)
+                or next((generated[code] for code in languages if code in generated), None)
+                or first_available
+            )
+
             transcript_data = None
             is_generated = False
             language_code = "en"
-
-            # First try manually created transcripts
-            try:
-                transcript = transcript_list.find_manually_created_transcript(languages)
+            if transcript is not None:
                 transcript_data = transcript.fetch()
-                is_generated = False
+                is_generated = transcript.is_generated
                 language_code = transcript.language_code
-            except NoTranscriptFound:
-                # Fall back to auto-generated
-                try:
-                    transcript = transcript_list.find_generated_transcript(languages)
-                    transcript_data = transcript.fetch()
-                    is_generated = True
-                    language_code = transcript.language_code
-                except NoTranscriptFound:
-                    # Try any available transcript
-                    available = list(transcript_list)
-                    if available:
-                        transcript = available[0]
-                        transcript_data = transcript.fetch()
-                        is_generated = transcript.is_generated
-                        language_code = transcript.language_code
 
             if not transcript_data:
-                return TranscriptResult(
-                    success=False,
-                    video_id=video_id,
-                    error_type="NoTranscriptFound",
-                    error_message="No transcript found for this video in any language.",
+                return self._failure(
+                    video_id,
+                    "NoTranscriptFound",
+                    "No transcript found for this video in any language.",
                 )
 
             # Convert to our model - handle both dict and FetchedTranscriptSnippet
-            segments = []
-            for seg in transcript_data:
-                # The new API returns objects with attributes, not dicts
-                if hasattr(seg, 'text'):
-                    segments.append(TranscriptSegment(
-                        text=seg.text,
-                        start=seg.start,
-                        duration=seg.duration,
-                    ))
-                else:
-                    # Fallback for dict format
-                    segments.append(TranscriptSegment(
-                        text=seg["text"],
-                        start=seg["start"],
-                        duration=seg["duration"],
-                    ))
+            # (the new API returns objects with attributes, not dicts). Snippets
+            # all share one type, so probe the first instead of every element.
+            if hasattr(next(iter(transcript_data)), 'text'):
+                raw_segments = [
+                    {"text": seg.text, "start": seg.start, "duration": seg.duration}
+                    for seg in transcript_data
+                ]
+            else:
+                raw_segments = list(transcript_data)
+            segments = TRANSCRIPT_SEGMENTS_ADAPTER.validate_python(raw_segments)
 
             transcript_obj = Transcript(
                 video_id=video_id,
@@ -148,18 +207,16 @@ class YouTubeService:
             )
 
         except TranscriptsDisabled:
-            return TranscriptResult(
-                success=False,
-                video_id=video_id,
-                error_type="TranscriptsDisabled",
-                error_message="Transcripts are disabled for this video by the owner.",
+            return self._failure(
+                video_id,
+                "TranscriptsDisabled",
+                "Transcripts are disabled for this video by the owner.",
             )
         except VideoUnavailable:
-            return TranscriptResult(
-                success=False,
-                video_id=video_id,
-                error_type="VideoUnavailable",
-                error_message="This video is unavailable, private, or has been removed.",
+            return self._failure(
+                video_id,
+                "VideoUnavailable",
+                "This video is unavailable, private, or has been removed.",
             )
         except Exception as e:
             error_type = type(e).__name__
@@ -170,6 +227,50 @@ class YouTubeService:
                 error_message=str(e),
             )
 
+    @staticmethod
+    def _failure(video_id: str, error_type: str, error_message: str) -> TranscriptResult:
+        """Build a failed result for a permanent error and remember it."""
+        _store_cached(_failure_cache, video_id, (error_type, error_message), _FAILURE_TTL)
+        return TranscriptResult(
+            success=False,
+            video_id=video_id,
+            error_type=error_type,
+            error_message=error_message,
+        )
+
+    def get_transcripts_bulk(
+        self,
+        video_ids_or_urls: list[str],
+        max_workers: int = 8,
+        use_cache: bool = True,
+    ) -> Generator[TranscriptResult, None, None]:
+        """
+        Get transcripts for several videos in parallel.
+
+        Args:
+            video_ids_or_urls: YouTube video IDs or URLs
+            max_workers: Maximum number of concurrent fetches
+            use_cache: Whether to use cached transcripts
+
+        Yields:
+            TranscriptResult for each video, in completion order. Fetches
+            not yet started are cancelled if the generator is closed early.
+        """
+        if not video_ids_or_urls:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids_or_urls)))
+        try:
+            futures = [
+                executor.submit(self.get_transcript, video, use_cache=use_cache)
+                for video in video_ids_or_urls
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # A consumer that stops early shouldn't wait for the remaining fetches
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_available_languages(self, video_id_or_url: str) -> dict:
         """
         Get available transcript languages for a video.
@@ -184,6 +285,10 @@ class YouTubeService:
         if not video_id:
             return {"error": "Invalid video ID", "manual": [], "generated": []}
 
+        cached = _get_cached(_languages_cache, video_id)
+        if cached is not None:
+            return cached
+
         try:
             transcript_list = self.api.list(video_id)
 
@@ -200,7 +305,9 @@ class YouTubeService:
                 else:
                     manual.append(lang_info)
 
-            return {"manual": manual, "generated": generated}
+            languages = {"manual": manual, "generated": generated}
+            _store_cached(_languages_cache, video_id, languages, _LANGUAGES_TTL)
+            return languages
 
         except Exception as e:
             return {"error": str(e), "manual": [], "generated": []}
@@ -211,21 +318,14 @@ class YouTubeService:
 
     def clear_cache(self, video_id: str) -> bool:
         """Clear the cached transcript for a video."""
+        _languages_cache.pop(video_id, None)
+        _failure_cache.pop(video_id, None)
         return self.transcript_repo.delete_by_video_id(video_id)
 
 
-def get_transcript_error_help(error_type: str) -> str:
-    """
-    Get user-friendly help text for transcript errors.
-
-    Args:
-        error_type: The error type from TranscriptResult
-
-    Returns:
-        Helpful message for the user
-    """
-    error_help = {
-        "TranscriptsDisabled": """
+# Help text for known transcript error types
+_ERROR_HELP: dict[str, str] = {
+    "TranscriptsDisabled": """
 **Transcripts are disabled for this video.**
 
 The video owner has disabled transcripts/captions for this video.
@@ -235,7 +335,7 @@ The video owner has disabled transcripts/captions for this video.
 2. Use YouTube's auto-generated captions directly on YouTube
 3. Try a different video that has captions enabled
 """,
-        "VideoUnavailable": """
+    "VideoUnavailable": """
 **This video is unavailable.**
 
 The video may be private, age-restricted, or has been removed.
@@ -245,7 +345,7 @@ The video may be private, age-restricted, or has been removed.
 2. Check if you can access the video directly on YouTube
 3. Make sure the video is publicly available
 """,
-        "NoTranscriptFound": """
+    "NoTranscriptFound": """
 **No transcript available for this video.**
 
 This video doesn't have transcripts in any supported language.
@@ -255,7 +355,7 @@ This video doesn't have transcripts in any supported language.
 2. Use YouTube's "Show transcript" feature (click ... below the video)
 3. Try a different video with captions
 """,
-        "InvalidURL": """
+    "InvalidURL": """
 **Invalid YouTube URL.**
 
 The URL provided doesn't appear to be a valid YouTube video URL.
@@ -265,11 +365,9 @@ The URL provided doesn't appear to be a valid YouTube video URL.
 - youtu.be/VIDEO_ID
 - youtube.com/embed/VIDEO_ID
 """,
-    }
+}
 
-    return error_help.get(
-        error_type,
-        f"""
+_DEFAULT_ERROR_HELP = """
 **Unable to extract transcript.**
 
 An error occurred while trying to get the transcript: {error_type}
@@ -278,8 +376,20 @@ An error occurred while trying to get the transcript: {error_type}
 1. Check your internet connection
 2. Try again in a few moments
 3. Use YouTube's built-in transcript feature
-""",
-    )
+"""
+
+
+def get_transcript_error_help(error_type: str) -> str:
+    """
+    Get user-friendly help text for transcript errors.
+
+    Args:
+        error_type: The error type from TranscriptResult
+
+    Returns:
+        Helpful message for the user
+    """
+    return _ERROR_HELP.get(error_type) or _DEFAULT_ERROR_HELP.format(error_type=error_type)
 
 
 # Global YouTube service instance
@@ -0,0 +1,16 @@
+"""Shared pytest setup for the backend tests."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend modules import each other as top-level packages (config, database, services)
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# Point settings at a throwaway database before anything imports config
+os.environ.setdefault(
+    "DATABASE_PATH", str(Path(tempfile.mkdtemp(prefix="localmind-tests-")) / "localmind.db")
+)
@@ -0,0 +1,23 @@
+"""Minimal stdio MCP server used by the MCP service tests."""
+
+import os
+
+from mcp.server.fastmcp import FastMCP
+
+server = FastMCP("echo")
+
+
+@server.tool()
+def echo(text: str) -> str:
+    """Return the given text unchanged."""
+    return text
+
+
+@server.tool()
+def pid() -> str:
+    """Return this server's process id."""
+    return str(os.getpid())
+
+
+if __name__ == "__main__":
+    server.run()
@@ -0,0 +1,67 @@
+"""Tests for the exact-match chat response cache key."""
+
+import pytest
+
+pytest.importorskip("openai")
+
+from services.llm_providers.base import ChatMessage
+from services.llm_providers.openai_compatible import OpenAICompatibleProvider
+
+
+def _provider(base_url: str = "http://localhost:8000/v1", model: str = "test-model") -> OpenAICompatibleProvider:
+    return OpenAICompatibleProvider(base_url=base_url, model=model)
+
+
+def _key(provider, messages, max_tokens=None, tools=None, temperature=0):
+    return provider._chat_cache_key(messages, temperature, max_tokens, tools)
+
+
+def test_non_deterministic_requests_are_not_cached():
+    assert _key(_provider(), [ChatMessage(role="user", content="hi")], temperature=0.7) is None
+
+
+def test_identical_requests_share_a_key():
+    messages = [ChatMessage(role="user", content="hi")]
+    assert _key(_provider(), messages) == _key(_provider(), list(messages))
+
+
+def test_key_covers_tool_calls_and_tool_call_id():
+    call = {"id": "call_1", "type": "function", "function": {"name": "search", "arguments": "{}"}}
+    base = [ChatMessage(role="assistant", content="")]
+    with_calls = [ChatMessage(role="assistant", content="", tool_calls=[call])]
+    tool_a = [ChatMessage(role="tool", content="42", tool_call_id="call_1")]
+    tool_b = [ChatMessage(role="tool", content="42", tool_call_id="call_2")]
+
+    provider = _provider()
+    assert _key(provider, base) != _key(provider, with_calls)
+    assert _key(provider, tool_a) != _key(provider, tool_b)
+
+
+def test_key_covers_endpoint_model_and_max_tokens():
+    messages = [ChatMessage(role="user", content="hi")]
+    key = _key(_provider(), messages)
+
+    assert key != _key(_provider(base_url="http://other:8000/v1"), messages)
+    assert key != _key(_provider(model="other-model"), messages)
+    assert key != _key(_provider(), messages, max_tokens=16)
+
+
+def test_key_covers_tools():
+    messages = [ChatMessage(role="user", content="hi")]
+    tool = {"type": "function", "function": {"name": "search", "parameters": {}}}
+    assert _key(_provider(), messages) != _key(_provider(), messages, tools=[tool])
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    from services.llm_providers import base
+
+    monkeypatch.setattr(base, "CHAT_CACHE_MAX", 2)
+    provider = _provider()
+    provider._store_cached_chat(b"a", "A")
+    provider._store_cached_chat(b"b", "B")
+    assert provider._get_cached_chat(b"a") == "A"
+    provider._store_cached_chat(b"c", "C")
+
+    assert provider._get_cached_chat(b"b") is None
+    assert provider._get_cached_chat(b"a") == "A"
+    assert provider._get_cached_chat(b"c") == "C"
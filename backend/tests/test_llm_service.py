@@ -0,0 +1,207 @@
+"""Tests for the LLM service module."""
+
+import importlib
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("ollama")
+
+from database.connection import init_db
+from database.models import LLMProvider
+from database.repositories.config_repository import ConfigRepository
+
+init_db()
+llm_module = importlib.import_module("services.llm_service")
+
+
+@pytest.fixture
+def provider_lookups(monkeypatch):
+    """Count default-provider lookups and start from an empty config cache."""
+    calls = []
+
+    def fake_lookup(self):
+        calls.append(1)
+        return LLMProvider(name="ollama", base_url="http://localhost:11434", model="qwen3:8b")
+
+    monkeypatch.setattr(ConfigRepository, "get_default_llm_provider_for_use", fake_lookup)
+    llm_module.invalidate_llm_config_cache()
+    yield calls
+    llm_module.invalidate_llm_config_cache()
+
+
+def test_module_builds_the_service_singleton():
+    assert isinstance(llm_module.llm_service, llm_module.LLMService)
+    assert isinstance(llm_module._get_llm_config_from_db(), dict)
+
+
+def test_config_lookup_is_cached(provider_lookups):
+    first = llm_module._get_llm_config_from_db()
+    second = llm_module._get_llm_config_from_db()
+
+    assert first == second == {
+        "provider": "ollama",
+        "base_url": "http://localhost:11434",
+        "api_key": "",
+        "model": "qwen3:8b",
+    }
+    assert len(provider_lookups) == 1
+
+    # Callers get copies, so mutating one doesn't poison the cache
+    first["model"] = "changed"
+    assert llm_module._get_llm_config_from_db()["model"] == "qwen3:8b"
+
+
+def test_config_cache_expires_after_ttl(provider_lookups):
+    llm_module._get_llm_config_from_db()
+    stamp, config = llm_module._CONFIG_CACHE
+    llm_module._CONFIG_CACHE = (stamp - llm_module._CONFIG_TTL - 1, config)
+
+    llm_module._get_llm_config_from_db()
+    assert len(provider_lookups) == 2
+
+
+def test_invalidate_drops_cached_config(provider_lookups):
+    llm_module._get_llm_config_from_db()
+    llm_module.invalidate_llm_config_cache()
+    llm_module._get_llm_config_from_db()
+    assert len(provider_lookups) == 2
+
+
+@pytest.fixture
+def probed_service(monkeypatch):
+    """An LLMService whose provider probes are counted instead of sent."""
+    llm_module._models_cache.clear()
+    llm_module._available_cache.clear()
+
+    service = llm_module.LLMService(base_url="http://probe-test:8000/v1", model="test-model")
+    calls = {"models": 0, "available": 0}
+    results = {"models": ["a", "b"], "available": True}
+
+    def get_models():
+        calls["models"] += 1
+        return list(results["models"])
+
+    def is_available():
+        calls["available"] += 1
+        return results["available"]
+
+    async def get_models_async():
+        return get_models()
+
+    monkeypatch.setattr(service._provider, "get_models", get_models)
+    monkeypatch.setattr(service._provider, "is_available", is_available)
+    monkeypatch.setattr(service._provider, "get_models_async", get_models_async)
+    yield service, calls, results
+    llm_module._models_cache.clear()
+    llm_module._available_cache.clear()
+
+
+def _expire(cache):
+    for key, (_, value) in list(cache.items()):
+        cache[key] = (0.0, value)
+
+
+def test_probe_results_are_cached(probed_service):
+    service, calls, _ = probed_service
+
+    assert service.get_models() == ["a", "b"]
+    assert service.get_models() == ["a", "b"]
+    assert service.is_available() is True
+    assert service.is_available() is True
+    assert calls == {"models": 1, "available": 1}
+
+    # Another service instance for the same endpoint shares the cache
+    other = llm_module.LLMService(base_url="http://probe-test:8000/v1", model="test-model")
+    assert other.get_models() == ["a", "b"]
+    assert calls["models"] == 1
+
+
+def test_async_probe_shares_the_cache(probed_service):
+    import asyncio
+
+    service, calls, _ = probed_service
+    assert asyncio.run(service.get_models_async()) == ["a", "b"]
+    assert service.get_models() == ["a", "b"]
+    assert calls["models"] == 1
+
+
+def test_probe_cache_expires(probed_service):
+    service, calls, _ = probed_service
+
+    service.get_models()
+    _expire(llm_module._models_cache)
+    service.get_models()
+    assert calls["models"] == 2
+
+
+def test_failed_probes_use_the_short_ttl(probed_service):
+    import time
+
+    service, _, results = probed_service
+    results["available"] = False
+    results["models"] = []
+
+    assert service.is_available() is False
+    assert service.get_models() == []
+
+    now = time.monotonic()
+    for cache in (llm_module._available_cache, llm_module._models_cache):
+        (expires_at, _), = cache.values()
+        assert expires_at <= now + llm_module._FAILED_PROBE_TTL
+
+
+def test_invalidating_an_endpoint_drops_probe_results(probed_service):
+    service, calls, _ = probed_service
+
+    service.get_models()
+    llm_module._invalidate_probe_caches(service.base_url)
+    service.get_models()
+    assert calls["models"] == 2
+
+
+def test_get_provider_reuses_pooled_instances():
+    first = llm_module.get_provider("openai_compatible", "http://pool-test:8000/v1", model="m")
+    assert llm_module.get_provider("openai_compatible", "http://pool-test:8000/v1", model="m") is first
+    assert llm_module.get_provider("openai_compatible", "http://pool-test:8000/v1", model="other") is not first
+
+
+@pytest.mark.parametrize(
+    ("base_url", "expected"),
+    [
+        ("http://localhost:11434", "ollama"),
+        ("http://OLLAMA.lan:8080/v1", "ollama"),
+        ("https://api.openai.com/v1", "openai"),
+        ("https://api.anthropic.com/v1", "claude"),
+        ("https://generativelanguage.googleapis.com/v1beta/openai", "gemini"),
+        ("https://api.cerebras.ai/v1", "cerebras"),
+        ("https://api.mistral.ai/v1", "mistral"),
+        ("http://localhost:8000/v1", "openai_compatible"),
+        ("", "openai_compatible"),
+        # Several markers: the earlier provider in priority order wins,
+        # regardless of where the marker appears in the URL
+        ("http://mistral-box.lan:11434/v1", "ollama"),
+        ("https://cerebras-proxy.example/mistral/v1", "cerebras"),
+        ("http://ollama-gateway/api.openai.com/v1", "ollama"),
+    ],
+)
+def test_detect_provider_priority(base_url, expected):
+    service = llm_module.LLMService(base_url="http://localhost:8000/v1", model="m")
+    assert service._detect_provider(base_url) == expected
+
+
+def test_database_errors_are_not_cached(monkeypatch):
+    import sqlite3
+
+    calls = []
+
+    def failing_lookup(self):
+        calls.append(1)
+        raise sqlite3.OperationalError("no such table: llm_providers")
+
+    monkeypatch.setattr(ConfigRepository, "get_default_llm_provider_for_use", failing_lookup)
+    llm_module.invalidate_llm_config_cache()
+
+    assert llm_module._get_llm_config_from_db() == {}
+    assert llm_module._get_llm_config_from_db() == {}
+    assert len(calls) == 2
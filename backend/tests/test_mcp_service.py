@@ -0,0 +1,183 @@
+"""Tests for starting and stopping MCP servers."""
+
+import asyncio
+import importlib
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from database.connection import init_db
+
+init_db()
+
+from database.models import MCPServer
+from services.mcp_service import MCPServerConnection, MCPService
+
+mcp_module = importlib.import_module("services.mcp_service")
+
+ECHO_SERVER = Path(__file__).resolve().parent / "echo_mcp_server.py"
+
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.fixture
+def service():
+    """An MCPService with two enabled echo servers configured."""
+    service = MCPService()
+    # Only this test's servers should be enabled
+    for existing in service.get_all_servers():
+        service.config_repo.delete_mcp_server(existing.id)
+
+    servers = [
+        service.create_server(
+            MCPServer(
+                name=f"echo-{i}",
+                transport_type="stdio",
+                command=sys.executable,
+                args=[str(ECHO_SERVER)],
+            )
+        )
+        for i in range(2)
+    ]
+    yield service, servers
+    for server in servers:
+        service.config_repo.delete_mcp_server(server.id)
+
+
+async def _server_pid(service: MCPService, server_id: str) -> int:
+    return int(await service.call_tool(server_id, "pid", {}))
+
+
+def test_start_all_enabled_and_stop_from_other_tasks(service, caplog):
+    """Servers started concurrently can be used and stopped from other tasks."""
+    service, servers = service
+    caplog.set_level(logging.WARNING, logger="services.mcp_service")
+
+    async def run() -> list[int]:
+        started = await service.start_all_enabled(concurrency=2)
+        assert started == {server.id: True for server in servers}
+
+        pids = []
+        for server in servers:
+            assert service.get_server_status(server.id) == "running"
+            tools = await service.list_tools(server.id)
+            assert {"echo", "pid"} <= {tool["name"] for tool in tools}
+            assert await service.call_tool(server.id, "echo", {"text": "hi"}) == "hi"
+            pids.append(await _server_pid(service, server.id))
+
+        # Stop from tasks other than the ones that started the servers
+        results = await asyncio.gather(*(service.stop_server(server.id) for server in servers))
+        assert results == [True, True]
+        for server in servers:
+            assert not service.is_server_running(server.id)
+            assert service.get_server_status(server.id) == "stopped"
+        return pids
+
+    for pid in asyncio.run(run()):
+        assert not _process_exists(pid)
+    # e.g. "Attempted to exit cancel scope in a different task"
+    assert not caplog.records
+
+
+def test_start_and_stop_single_server(service):
+    service, servers = service
+    server = servers[0]
+
+    async def run() -> int:
+        assert await service.start_server(server.id) is True
+        assert service.is_server_running(server.id)
+        pid = await _server_pid(service, server.id)
+        assert await service.stop_server(server.id) is True
+        assert not service.is_server_running(server.id)
+        return pid
+
+    assert not _process_exists(asyncio.run(run()))
+
+
+def test_failed_start_reports_error(service):
+    service, _ = service
+    broken = service.create_server(
+        MCPServer(
+            name="broken",
+            transport_type="stdio",
+            command=sys.executable,
+            args=["-c", "import sys; sys.exit(1)"],
+        )
+    )
+    try:
+        assert asyncio.run(service.start_server(broken.id)) is False
+        assert service.get_server_status(broken.id).startswith("error")
+        assert not service.is_server_running(broken.id)
+    finally:
+        service.config_repo.delete_mcp_server(broken.id)
+
+
+def test_delete_server_stops_it(service):
+    service, servers = service
+    server = servers[0]
+
+    async def run() -> int:
+        assert await service.start_server(server.id) is True
+        pid = await _server_pid(service, server.id)
+        assert await service.delete_server(server.id) is True
+        assert not service.is_server_running(server.id)
+        return pid
+
+    assert not _process_exists(asyncio.run(run()))
+    assert service.get_server(server.id) is None
+
+
+def test_stop_timeout_is_reported_as_failure(service, monkeypatch, caplog):
+    """A server that doesn't stop in time is cancelled and reported as errored."""
+    service, servers = service
+    server = servers[0]
+    monkeypatch.setattr(mcp_module, "MCP_STOP_TIMEOUT", 0.05)
+
+    async def hang(self) -> None:
+        await asyncio.Event().wait()
+
+    async def run() -> int:
+        assert await service.start_server(server.id) is True
+        pid = await _server_pid(service, server.id)
+        conn = service._servers[server.id].conn
+        owner = conn._owner_task
+        monkeypatch.setattr(MCPServerConnection, "disconnect", hang)
+
+        assert await service.stop_server(server.id) is False
+        assert service.get_server_status(server.id).startswith("error")
+        assert not service.is_server_running(server.id)
+
+        # The fallback cancels the owner task
+        await asyncio.wait({owner})
+        assert owner.cancelled()
+        return pid
+
+    with caplog.at_level(logging.ERROR, logger="services.mcp_service"):
+        pid = asyncio.run(run())
+    assert str(ECHO_SERVER) in caplog.text
+    assert not _process_exists(pid)
+
+
+def test_aclose_stops_all_servers(service):
+    service, servers = service
+
+    async def run() -> list[int]:
+        await service.start_all_enabled()
+        pids = [await _server_pid(service, server.id) for server in servers]
+        await service.aclose()
+        assert not any(service.is_server_running(server.id) for server in servers)
+        return pids
+
+    for pid in asyncio.run(run()):
+        assert not _process_exists(pid)
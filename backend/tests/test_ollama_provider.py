@@ -0,0 +1,67 @@
+"""Tests for the native Ollama provider's streaming."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ollama")
+
+from services.llm_providers.base import ChatMessage
+from services.llm_providers.ollama_provider import OllamaProvider
+
+_CHUNKS = [
+    {"message": {"thinking": "let me think"}},
+    {"message": {"content": "Hello <|im_"}},
+    {"message": {"content": "end|> world"}},
+    {"message": {"tool_calls": [{"function": {"name": "search", "arguments": {"q": "x"}}}]}},
+    {"message": {"content": " <"}},
+    {"done": True, "eval_count": 10, "eval_duration": 2_000_000_000, "prompt_eval_count": 5},
+]
+
+
+def _summarize(out):
+    return [
+        (c.type, c.content, c.thinking, c.tool_call.name if c.tool_call else None)
+        for c in out
+    ]
+
+
+def _provider():
+    provider = OllamaProvider(base_url="http://localhost:11434", model="qwen3:8b")
+    provider.client = SimpleNamespace(chat=lambda **kwargs: iter(_CHUNKS))
+
+    async def achat(**kwargs):
+        async def stream():
+            for chunk in _CHUNKS:
+                yield chunk
+        return stream()
+
+    provider.async_client = SimpleNamespace(chat=achat)
+    return provider
+
+
+def test_stream_splits_thinking_content_and_tool_calls():
+    out = list(_provider().chat_stream([ChatMessage(role="user", content="hi")]))
+
+    assert _summarize(out) == [
+        ("thinking", None, "let me think", None),
+        ("content", "Hello ", None, None),
+        ("content", " world", None, None),
+        ("tool_call", None, None, "search"),
+        ("content", " ", None, None),
+        ("content", "<", None, None),
+        ("done", None, None, None),
+    ]
+    assert out[-1].metrics.completion_tokens == 10
+    assert out[-1].metrics.tokens_per_second == 5.0
+
+
+def test_async_stream_matches_sync_stream():
+    provider = _provider()
+    messages = [ChatMessage(role="user", content="hi")]
+
+    async def run():
+        return [chunk async for chunk in provider.chat_stream_async(messages)]
+
+    assert _summarize(asyncio.run(run())) == _summarize(list(provider.chat_stream(messages)))
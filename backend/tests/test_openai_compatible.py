@@ -0,0 +1,150 @@
+"""Tests for the OpenAI-compatible provider."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from services.llm_providers import openai_compatible
+from services.llm_providers.base import ChatMessage
+from services.llm_providers.openai_compatible import OpenAICompatibleProvider
+
+
+def test_async_client_survives_pool_shutdown():
+    """Closing the shared pool (lifespan shutdown) doesn't break later requests."""
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+
+    async def run() -> None:
+        first = provider._get_async_client()
+        assert provider._get_async_client() is first
+
+        await openai_compatible.aclose_shared_http_clients()
+        second = provider._get_async_client()
+        assert second is not first
+        assert not openai_compatible._get_async_http_client().is_closed
+
+    asyncio.run(run())
+
+
+def test_async_pool_is_per_event_loop():
+    async def pool():
+        return openai_compatible._get_async_http_client()
+
+    assert asyncio.run(pool()) is not asyncio.run(pool())
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+def _tool_call_delta():
+    return SimpleNamespace(
+        index=0,
+        id="call_1",
+        function=SimpleNamespace(name="search", arguments='{"q": "x"}'),
+    )
+
+
+# The second chunk's content is fully held back as a possible token prefix;
+# its tool call and finish reason must still be processed.
+_HELD_BACK_TOOL_STREAM = [
+    _chunk(content="Hi"),
+    _chunk(content="<", tool_calls=[_tool_call_delta()], finish_reason="tool_calls"),
+]
+
+
+def _fake_client(chunks, is_async=False):
+    if is_async:
+        async def create(**kwargs):
+            async def stream():
+                for chunk in chunks:
+                    yield chunk
+            return stream()
+    else:
+        def create(**kwargs):
+            return iter(chunks)
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def _check_stream_output(out):
+    tool_calls = [c.tool_call for c in out if c.type == "tool_call"]
+    assert [(tc.id, tc.name, tc.arguments) for tc in tool_calls] == [("call_1", "search", {"q": "x"})]
+    assert "".join(c.content for c in out if c.type == "content") == "Hi<"
+    assert out[-1].type == "done"
+
+
+def test_stream_processes_tool_calls_of_held_back_delta():
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+    provider.client = _fake_client(_HELD_BACK_TOOL_STREAM)
+
+    messages = [ChatMessage(role="user", content="hi")]
+    _check_stream_output(list(provider.chat_stream(messages, think=False)))
+
+
+def test_async_stream_processes_tool_calls_of_held_back_delta(monkeypatch):
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+    fake = _fake_client(_HELD_BACK_TOOL_STREAM, is_async=True)
+    monkeypatch.setattr(provider, "_get_async_client", lambda: fake)
+
+    async def run():
+        messages = [ChatMessage(role="user", content="hi")]
+        return [chunk async for chunk in provider.chat_stream_async(messages, think=False)]
+
+    _check_stream_output(asyncio.run(run()))
+
+
+def test_chat_async_uses_lazy_async_client(monkeypatch):
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content="hello")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(provider, "_get_async_client", lambda: fake)
+
+    messages = [ChatMessage(role="user", content="hi")]
+    assert asyncio.run(provider.chat_async(messages, temperature=0)) == "hello"
+    # Deterministic responses are served from the cache the second time
+    assert asyncio.run(provider.chat_async(messages, temperature=0)) == "hello"
+    assert len(calls) == 1
+
+
+def _completion_client(answer):
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=answer))])
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response))
+    )
+
+
+def test_client_override_bypasses_the_response_cache():
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+    provider.client = _completion_client("own endpoint")
+    messages = [ChatMessage(role="user", content="hi")]
+
+    assert provider.chat(messages, temperature=0) == "own endpoint"
+
+    with openai_compatible.client_override("http://other:8000/v1", api_key="other-key"):
+        assert provider._chat_cache_key(messages, 0, None) is None
+        openai_compatible._CLIENT_CTX.set(_completion_client("override endpoint"))
+        assert provider.chat(messages, temperature=0) == "override endpoint"
+
+    # The override's answer was not cached for the provider's own endpoint
+    assert provider.chat(messages, temperature=0) == "own endpoint"
+
+
+def test_client_override_routes_async_requests():
+    provider = OpenAICompatibleProvider(base_url="http://localhost:8000/v1", model="test-model")
+
+    async def run():
+        with openai_compatible.client_override("http://other:8000/v1"):
+            override = provider._get_async_client()
+            assert str(override.base_url).startswith("http://other:8000/v1")
+        assert provider._get_async_client() is not override
+
+    asyncio.run(run())
@@ -0,0 +1,49 @@
+"""Tests for special-token cleaning of streamed deltas."""
+
+from services.llm_providers.base import clean_llm_output, clean_llm_stream_delta
+
+
+def _stream(deltas: list[str]) -> str:
+    """Feed deltas through the cleaner and return everything it emits."""
+    emitted = []
+    tail = ""
+    for delta in deltas:
+        text, tail = clean_llm_stream_delta(tail, delta)
+        emitted.append(text)
+    return "".join(emitted) + tail
+
+
+def test_plain_delta_passes_through():
+    assert clean_llm_stream_delta("", "hello world") == ("hello world", "")
+
+
+def test_whole_token_is_removed():
+    assert clean_llm_stream_delta("", "done<|im_end|>") == ("done", "")
+
+
+def test_token_split_across_deltas_is_removed():
+    text, tail = clean_llm_stream_delta("", "Hello <|im_")
+    assert (text, tail) == ("Hello ", "<|im_")
+
+    text, tail = clean_llm_stream_delta(tail, "end|> there")
+    assert (text, tail) == (" there", "")
+
+
+def test_token_split_into_many_pieces():
+    assert _stream(["a<", "|", "end", "oftext", "|>b"]) == "ab"
+
+
+def test_angle_bracket_that_is_not_a_token_is_kept():
+    assert clean_llm_stream_delta("", "a < b") == ("a < b", "")
+    assert _stream(["x <", "3"]) == "x <3"
+
+
+def test_held_back_prefix_is_released_at_end_of_stream():
+    text, tail = clean_llm_stream_delta("", "trailing <|")
+    assert text == "trailing "
+    assert tail == "<|"
+
+
+def test_matches_whole_output_cleaning():
+    deltas = ["<|im_start|>assistant\n", "Hi", " <|im", "_end|>"]
+    assert _stream(deltas) == clean_llm_output("".join(deltas))
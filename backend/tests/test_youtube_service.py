@@ -0,0 +1,66 @@
+"""Tests for bulk YouTube transcript fetching."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("youtube_transcript_api")
+
+from database.connection import init_db
+
+init_db()
+
+from services.youtube_service import TranscriptResult, YouTubeService
+
+
+@pytest.fixture
+def service():
+    return YouTubeService()
+
+
+def test_bulk_results_come_back_in_completion_order(service, monkeypatch):
+    release_slow = threading.Event()
+
+    def get_transcript(video_id, use_cache=True):
+        if video_id == "slow":
+            assert release_slow.wait(5)
+        return TranscriptResult(success=True, video_id=video_id)
+
+    monkeypatch.setattr(service, "get_transcript", get_transcript)
+
+    results = service.get_transcripts_bulk(["slow", "fast"], max_workers=2)
+    assert next(results).video_id == "fast"
+    release_slow.set()
+    assert next(results).video_id == "slow"
+    assert next(results, None) is None
+
+
+def test_bulk_early_exit_does_not_wait_for_pending_fetches(service, monkeypatch):
+    release = threading.Event()
+    called = []
+
+    def get_transcript(video_id, use_cache=True):
+        called.append(video_id)
+        if video_id != "first":
+            release.wait(5)
+        return TranscriptResult(success=True, video_id=video_id)
+
+    monkeypatch.setattr(service, "get_transcript", get_transcript)
+
+    results = service.get_transcripts_bulk(["first", "second", "third"], max_workers=1)
+    try:
+        assert next(results).video_id == "first"
+        start = time.monotonic()
+        results.close()
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+
+    # The queued fetch was cancelled rather than run after the consumer left
+    time.sleep(0.1)
+    assert "third" not in called
+
+
+def test_bulk_with_no_videos_yields_nothing(service):
+    assert list(service.get_transcripts_bulk([])) == []
@@ -11,10 +11,8 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp (MM:SS or HH:MM:SS)
     """
-    total_seconds = int(seconds)
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
 
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -32,10 +30,9 @@ def parse_timestamp(timestamp: str) -> float:
         Time in seconds
     """
     parts = timestamp.split(":")
-    if len(parts) == 2:
-        minutes, seconds = map(int, parts)
-        return minutes * 60 + seconds
-    elif len(parts) == 3:
-        hours, minutes, seconds = map(int, parts)
-        return hours * 3600 + minutes * 60 + seconds
+    count = len(parts)
+    if count == 2:
+        return int(parts[0]) * 60 + int(parts[1])
+    elif count == 3:
+        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
     return 0.0
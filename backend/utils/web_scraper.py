@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Maximum HTML bytes read by the fallback (its output is truncated to 10k chars anyway)
+MAX_FALLBACK_BYTES = 2_000_000
+
 
 def fetch_and_extract(url: str) -> str:
     """Fetch URL and extract main content as Markdown.
@@ -44,14 +47,23 @@ def fetch_and_extract(url: str) -> str:
     # Method 2: Fallback to requests + BeautifulSoup (Raw text)
     logger.info("Falling back to requests + BeautifulSoup")
     try:
-        response = requests.get(
-            url, 
-            headers={"User-Agent": USER_AGENT}, 
-            timeout=15
-        )
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Stream the body so huge pages aren't downloaded and parsed in full
+        with requests.get(
+            url,
+            headers={"User-Agent": USER_AGENT},
+            timeout=15,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= MAX_FALLBACK_BYTES:
+                    logger.info(f"Truncating fallback download at {MAX_FALLBACK_BYTES} bytes")
+                    break
+            encoding = response.encoding
+
+        soup = BeautifulSoup(bytes(body[:MAX_FALLBACK_BYTES]), "html.parser", from_encoding=encoding)
         
         # Remove script and style elements
         for script in soup(["script", "style", "nav", "footer", "header"]):
@@ -3,22 +3,22 @@
 import re
 from typing import Optional
 
-# Patterns for matching YouTube URLs
-YOUTUBE_PATTERNS = [
-    # Standard watch URLs
-    r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-    # Short URLs
-    r"(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]{11})",
-    # Embed URLs
-    r"(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-    # Mobile URLs
-    r"(?:https?://)?m\.youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-    # YouTube Shorts
-    r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-]
-
-# Combined pattern for URL detection
-YOUTUBE_URL_PATTERN = re.compile(
+# Prefer RE2's linear-time matcher for URL scanning when google-re2 is installed
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Bare 11-character video ID
+VIDEO_ID_PATTERN = _regex.compile(r"^[a-zA-Z0-9_-]{11}$")
+
+# URL prefixes shared by every built link
+_WATCH_URL_PREFIX = "https://www.youtube.com/watch?v="
+_EMBED_URL_PREFIX = "https://www.youtube.com/embed/"
+_EMBED_URL_SUFFIX = "?enablejsapi=1&rel=0"
+
+# Combined pattern for watch, short, embed, mobile and Shorts URLs
+YOUTUBE_URL_PATTERN = _regex.compile(
     r"(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|embed/|shorts/)|youtu\.be/)([a-zA-Z0-9_-]{11})"
 )
 
@@ -34,16 +34,11 @@ def extract_video_id(url: str) -> Optional[str]:
         The 11-character video ID, or None if not found
     """
     # If it's already just a video ID (11 chars, alphanumeric with - and _)
-    if re.match(r"^[a-zA-Z0-9_-]{11}$", url):
+    if VIDEO_ID_PATTERN.match(url):
         return url
 
-    # Try each pattern
-    for pattern in YOUTUBE_PATTERNS:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = YOUTUBE_URL_PATTERN.search(url)
+    return match.group(1) if match else None
 
 
 def is_youtube_url(text: str) -> bool:
@@ -69,19 +64,12 @@ def find_youtube_urls(text: str) -> list[dict[str, str]]:
     Returns:
         List of dicts with 'url' and 'video_id' keys
     """
-    results = []
-    seen_ids = set()
-
+    # video_id -> first URL it appeared in (dicts keep insertion order)
+    urls: dict[str, str] = {}
     for match in YOUTUBE_URL_PATTERN.finditer(text):
-        video_id = match.group(1)
-        if video_id not in seen_ids:
-            seen_ids.add(video_id)
-            results.append({
-                "url": match.group(0),
-                "video_id": video_id,
-            })
+        urls.setdefault(match.group(1), match.group(0))
 
-    return results
+    return [{"url": url, "video_id": video_id} for video_id, url in urls.items()]
 
 
 def build_youtube_url(video_id: str, timestamp: Optional[float] = None) -> str:
@@ -95,10 +83,9 @@ def build_youtube_url(video_id: str, timestamp: Optional[float] = None) -> str:
     Returns:
         A YouTube watch URL
     """
-    url = f"https://www.youtube.com/watch?v={video_id}"
     if timestamp is not None and timestamp > 0:
-        url += f"&t={int(timestamp)}s"
-    return url
+        return f"{_WATCH_URL_PREFIX}{video_id}&t={int(timestamp)}s"
+    return _WATCH_URL_PREFIX + video_id
 
 
 def build_embed_url(video_id: str, timestamp: Optional[float] = None) -> str:
@@ -112,7 +99,6 @@ def build_embed_url(video_id: str, timestamp: Optional[float] = None) -> str:
     Returns:
         A YouTube embed URL
     """
-    url = f"https://www.youtube.com/embed/{video_id}?enablejsapi=1&rel=0"
     if timestamp is not None and timestamp > 0:
-        url += f"&start={int(timestamp)}"
-    return url
+        return f"{_EMBED_URL_PREFIX}{video_id}{_EMBED_URL_SUFFIX}&start={int(timestamp)}"
+    return _EMBED_URL_PREFIX + video_id + _EMBED_URL_SUFFIX
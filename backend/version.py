@@ -1,6 +1,7 @@
 """Version information for LocalMind backend."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Try to read version from VERSION file (created at build time)
@@ -9,6 +10,7 @@ _VERSION_FILE = Path(__file__).parent.parent / "VERSION"
 _BACKEND_VERSION_FILE = Path(__file__).parent / "VERSION"
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Get the application version."""
     # Check for VERSION file in backend directory first (Docker builds)
@@ -26,6 +28,7 @@ def get_version() -> str:
     return "0.0.0-dev"
 
 
+@lru_cache(maxsize=1)
 def get_git_commit() -> str:
     """Get the git commit hash if available."""
     # Check environment variable (set during Docker build)